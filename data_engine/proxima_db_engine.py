@@ -37,7 +37,7 @@ class ProximaDB:
         if "logs_simulation" not in self.db.list_collection_names():
             self.db.create_collection(
                 "logs_simulation",
-                timeseries={"timeField": "timestamp", "metaField": "experiment_id", "granularity": "seconds"},
+                timeseries={"timeField": "timestamp", "metaField": "experiment_id", "granularity": "hours"},
             )
             print("✅ Created 'logs_simulation' as a time series collection.")
         else:
@@ -20,10 +20,19 @@ class RoverStatus(Enum):
     THROTTLED = "throttled"
 
 
+# Compact int8 status codes used by array-backed rover fleets (code == position in ROVER_STATUSES)
+ROVER_STATUSES = tuple(RoverStatus)
+ROVER_STATUS_CODES = {status: code for code, status in enumerate(ROVER_STATUSES)}
+
+
 class ScienceRover(Agent):
     """
     A science rover that operates on battery power, generates science, and recharges
     from the grid when its battery is too low to operate.
+
+    A rover can be bound to a fleet (e.g. the ScienceSector) that keeps rover state in NumPy arrays.
+    Once bound, the battery, science buffer and status attributes are views onto the fleet's arrays
+    (rover_battery_kWh, rover_science_buffer, rover_status) at the rover's index.
     """
 
     def __init__(self, unique_id, model, agent_config: dict):
@@ -31,24 +40,90 @@ class ScienceRover(Agent):
         Initializes a Science Rover agent.
 
         Args:
-            unique_id: A unique identifier for the agent.
+            unique_id: A unique identifier for the agent. An integer n is reported as "science_rover_<n>".
             model: The model instance the agent belongs to.
             agent_config (dict): Agent-specific configuration.
         """
         super().__init__(model)
 
         self.config = agent_config.get("config", agent_config)
-        self.unique_id = unique_id
+        self._rover_id = unique_id
 
         # Configuration Parameters
         self.power_usage_kWh = float(self.config.get("power_usage_kWh", 0.2))
         self.science_generation = float(self.config.get("science_generation", 0.5))
         self.battery_capacity_kWh = float(self.config.get("battery_capacity_kWh", 20))
 
-        # State variables
-        self.current_battery_kWh = float(self.config.get("current_battery_kWh", self.battery_capacity_kWh))
-        self.science_buffer = float(self.config.get("science_buffer", 0.0))
-        self.status = RoverStatus(self.config.get("status", RoverStatus.IDLE.value))
+        # State variables (held locally until the rover is bound to a fleet)
+        self._fleet = None
+        self._index = -1
+        self._current_battery_kWh = float(self.config.get("current_battery_kWh", self.battery_capacity_kWh))
+        self._science_buffer = float(self.config.get("science_buffer", 0.0))
+        self._status = RoverStatus(self.config.get("status", RoverStatus.IDLE.value))
+
+    @property
+    def unique_id(self):
+        """Rover id. Integer ids are kept as-is and only formatted as 'science_rover_<n>' when read."""
+        rover_id = self._rover_id
+        return f"science_rover_{rover_id}" if isinstance(rover_id, int) else rover_id
+
+    @unique_id.setter
+    def unique_id(self, value) -> None:
+        # mesa's Agent.__init__ assigns its own counter first; the constructor then sets the rover id
+        self._rover_id = value
+
+    def bind(self, fleet, index: int) -> None:
+        """Move this rover's state into the fleet's arrays at the given index and read it from there."""
+        fleet.rover_battery_kWh[index] = self._current_battery_kWh
+        fleet.rover_science_buffer[index] = self._science_buffer
+        fleet.rover_status[index] = ROVER_STATUS_CODES[self._status]
+        self._fleet = fleet
+        self._index = index
+
+    @property
+    def current_battery_kWh(self) -> float:
+        if self._fleet is None:
+            return self._current_battery_kWh
+        return float(self._fleet.rover_battery_kWh[self._index])
+
+    @current_battery_kWh.setter
+    def current_battery_kWh(self, value: float) -> None:
+        if self._fleet is None:
+            self._current_battery_kWh = value
+        else:
+            self._fleet.rover_battery_kWh[self._index] = value
+
+    @property
+    def science_buffer(self) -> float:
+        if self._fleet is None:
+            return self._science_buffer
+        return float(self._fleet.rover_science_buffer[self._index])
+
+    @science_buffer.setter
+    def science_buffer(self, value: float) -> None:
+        if self._fleet is None:
+            self._science_buffer = value
+        else:
+            self._fleet.rover_science_buffer[self._index] = value
+
+    @property
+    def status(self) -> RoverStatus:
+        if self._fleet is None:
+            return self._status
+        return ROVER_STATUSES[self._fleet.rover_status[self._index]]
+
+    @status.setter
+    def status(self, value: RoverStatus) -> None:
+        if self._fleet is None:
+            self._status = value
+        else:
+            self._fleet.rover_status[self._index] = ROVER_STATUS_CODES[value]
+
+    def get_power_demand(self) -> float:
+        """Return the charge needed from the grid if the battery cannot cover the next operation."""
+        if self.current_battery_kWh < self.power_usage_kWh:
+            return self.battery_capacity_kWh - self.current_battery_kWh
+        return 0.0
 
     def step(self, available_energy_kWh: float) -> tuple:
         """
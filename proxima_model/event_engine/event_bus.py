@@ -1,5 +1,6 @@
-from collections import defaultdict
-from typing import Callable, Dict, List
+from contextlib import contextmanager
+from typing import Callable, List, Tuple
+from proxima_model.world_system.world_system_defs import EventType
 import threading
 import logging
 
@@ -10,42 +11,70 @@ class EventBus:
     """A thread-safe event bus for publishing and subscribing to events."""
 
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        # Handler table indexed by integer event id (EventType values are dense, starting at 0). Entries are
+        # immutable tuples replaced on (un)subscribe, so publish can read them without taking the lock
+        self._subscribers: List[Tuple[Callable, ...]] = [() for _ in range(max(EventType) + 1)]
         self._lock = threading.Lock()
+        self._local = threading.local()  # Per-thread queue of deferred events (see defer_events)
 
-    def subscribe(self, event_type: str, callback_fn: Callable):
+    def subscribe(self, event_type: int, callback_fn: Callable):
         """Register a function to be called when an event of a certain type is published."""
+        if not 0 <= event_type < len(self._subscribers):
+            raise ValueError(f"Unknown event id: {event_type}")
+
         with self._lock:
             if callback_fn not in self._subscribers[event_type]:
-                self._subscribers[event_type].append(callback_fn)
+                self._subscribers[event_type] += (callback_fn,)
 
-    def unsubscribe(self, event_type: str, callback_fn: Callable):
+    def unsubscribe(self, event_type: int, callback_fn: Callable):
         """Remove a callback from an event type."""
         with self._lock:
-            if event_type in self._subscribers:
-                try:
-                    self._subscribers[event_type].remove(callback_fn)
-                except ValueError:
-                    logger.warning(f"Callback not found for event {event_type}")
+            callbacks = self._subscribers[event_type] if 0 <= event_type < len(self._subscribers) else ()
+            if callback_fn not in callbacks:
+                logger.warning(f"Callback not found for event {event_type}")
+                return
 
-    def publish(self, event_type: str, **kwargs):
+            index = callbacks.index(callback_fn)
+            self._subscribers[event_type] = callbacks[:index] + callbacks[index + 1 :]
+
+    def publish(self, event_type: int, **kwargs):
         """Publish an event, triggering all subscribed callbacks."""
-        with self._lock:
-            if event_type not in self._subscribers:
-                return
+        deferred = getattr(self._local, "deferred", None)
+        if deferred is not None:
+            deferred.append((event_type, kwargs))
+            return
 
-            # Copy the list to avoid issues if subscribers modify during iteration
-            callbacks = self._subscribers[event_type][:]
+        # Snapshot of the handlers; subscribers changing during dispatch replace the tuple, not this one. Events
+        # nobody can subscribe to (unknown or non-integer ids) have no handlers and are ignored
+        try:
+            callbacks = self._subscribers[event_type] if event_type >= 0 else ()
+        except (IndexError, TypeError):
+            return
 
-        # Call callbacks outside the lock to avoid blocking
         for callback_fn in callbacks:
             try:
                 callback_fn(**kwargs)
             except Exception as e:
-                logger.error(f"Error in callback for event {event_type}: {e}")
+                logger.error(f"Error in callback for event {EventType(event_type).name}: {e}")
                 # Continue to next callback instead of stopping
 
-    def get_subscriber_count(self, event_type: str) -> int:
+    @contextmanager
+    def defer_events(self):
+        """
+        Queue events published from the current thread instead of dispatching them.
+
+        Yields the list of queued (event_type, kwargs) pairs; the caller is responsible for publishing them.
+        """
+        queued = []
+        self._local.deferred = queued
+        try:
+            yield queued
+        finally:
+            self._local.deferred = None
+
+    def get_subscriber_count(self, event_type: int) -> int:
         """Get the number of subscribers for an event type (for debugging)."""
-        with self._lock:
-            return len(self._subscribers.get(event_type, []))
+        try:
+            return len(self._subscribers[event_type]) if event_type >= 0 else 0
+        except (IndexError, TypeError):
+            return 0
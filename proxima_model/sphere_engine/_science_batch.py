@@ -0,0 +1,116 @@
+"""
+_science_batch.py
+
+Batched rover fleet step for one or more ScienceSector instances.
+The fleets' arrays are stacked so every sector is stepped with a single set of vectorized operations.
+"""
+
+from proxima_model.components.science_rover import RoverStatus, ROVER_STATUS_CODES
+
+import numpy as np
+
+_OPERATIONAL = ROVER_STATUS_CODES[RoverStatus.OPERATIONAL]
+_CHARGING = ROVER_STATUS_CODES[RoverStatus.CHARGING]
+_LOW_BATTERY = ROVER_STATUS_CODES[RoverStatus.LOW_BATTERY]
+_THROTTLED = ROVER_STATUS_CODES[RoverStatus.THROTTLED]
+
+
+def step_all(sectors, available_powers) -> list:
+    """
+    Step the rover fleets of several science sectors at once.
+
+    Each sector's fleet arrays are concatenated, stepped together and scattered back. Power is still handed
+    out per sector: every rover only competes with earlier rovers of its own sector. Each sector then
+    records the step (science totals, history, growth rate) as if it had been stepped on its own.
+
+    Args:
+        sectors: ScienceSector instances to step.
+        available_powers: Power available to each sector this step, index-aligned with sectors.
+
+    Returns:
+        A list of (power_used, science_generated) tuples, one per sector.
+    """
+
+    counts = np.array([len(sector.science_rovers) for sector in sectors], dtype=np.intp)
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    segment = np.repeat(np.arange(len(sectors)), counts)
+    available = np.asarray(available_powers, dtype=float)
+
+    battery = np.concatenate([sector.rover_battery_kWh for sector in sectors])
+    capacity = np.concatenate([sector.rover_battery_capacity_kWh for sector in sectors])
+    usage = np.concatenate([sector.rover_power_usage_kWh for sector in sectors])
+    generation = np.concatenate([sector.rover_science_generation for sector in sectors])
+    buffer = np.concatenate([sector.rover_science_buffer for sector in sectors])
+
+    # Probabilistic throttling: skip rover with probability = its sector's throttle_factor
+    active = np.concatenate(
+        [sector._rng.random(count) >= sector.throttle_factor for sector, count in zip(sectors, counts)]
+    )
+
+    status, power_used, science, operational, power_demand = step_fleet(
+        battery, capacity, usage, generation, buffer, active, segment, bounds, available
+    )
+
+    results = []
+    for i, sector in enumerate(sectors):
+        start, end = bounds[i], bounds[i + 1]
+        sector.rover_battery_kWh[:] = battery[start:end]
+        sector.rover_science_buffer[:] = buffer[start:end]
+        sector.rover_status = status[start:end].copy()
+        sector._operational_count = int(operational[i])
+        sector._rover_power_demand = float(power_demand[i])
+        sector._record_step(float(science[i]))
+        results.append((float(power_used[i]), sector.step_science_generated))
+    return results
+
+
+def step_fleet(battery, capacity, usage, generation, buffer, active, segment, bounds, available):
+    """
+    Numeric kernel of the rover fleet step, operating on plain arrays only.
+
+    battery and buffer are updated in place. Rovers are grouped into contiguous segments
+    (segment[i] is rover i's group, bounds the group start/end offsets), and power is handed out within each
+    group in rover order from that group's available power.
+
+    Returns:
+        (status, power_used, science, operational, power_demand): per-rover int8 status codes, then per-group
+        grid power drawn, science generated, operating rover count and outstanding charging demand.
+    """
+
+    n_groups = len(available)
+    counts = np.diff(bounds)
+
+    # Active rovers with enough charge operate from their battery and draw nothing from the grid
+    operating = active & (battery >= usage)
+    np.subtract(battery, usage, out=battery, where=operating)
+    np.add(buffer, generation, out=buffer, where=operating)
+
+    # The rest charge from the grid. Power is handed out in rover order within each group, so each rover gets
+    # its even share capped by what earlier rovers of the same group left over
+    charging = active & ~operating
+    if charging.any() and available.any():
+        power_per_rover = np.divide(available, counts, out=np.zeros(n_groups), where=counts > 0)
+        wanted = np.where(charging, np.minimum(capacity - battery, power_per_rover[segment]), 0.0)
+        wanted_total = np.concatenate(([0.0], np.cumsum(wanted)))
+        wanted_before = wanted_total[:-1] - wanted_total[bounds[:-1]][segment]
+        granted = np.clip(available[segment] - wanted_before, 0.0, wanted)
+        battery += granted
+    else:
+        # Nobody is charging or there is no power to hand out: skip the prefix scan
+        granted = np.zeros_like(battery)
+
+    # Charging rovers that still cannot operate are low on battery
+    status = np.select(
+        [~active, operating, battery < usage],
+        [_THROTTLED, _OPERATIONAL, _LOW_BATTERY],
+        default=_CHARGING,
+    ).astype(np.int8)
+
+    # Rovers that cannot cover their next operation request a full recharge
+    demand = np.where(battery < usage, capacity - battery, 0.0)
+
+    power_used = np.bincount(segment, weights=granted, minlength=n_groups)
+    science = np.bincount(segment, weights=np.where(operating, generation, 0.0), minlength=n_groups)
+    operational = np.bincount(segment, weights=operating, minlength=n_groups)
+    power_demand = np.bincount(segment, weights=demand, minlength=n_groups)
+    return status, power_used, science, operational, power_demand
@@ -122,26 +122,29 @@ class ConstructionSector:
         self.modules_completed_this_step = 0
         self.shells_produced_this_step = 0
 
-    def handle_construction_request(self, requesting_sphere: str, module_id: str, shell_quantity: int) -> None:
-        """Handle incoming construction request."""
+    def handle_construction_request(
+        self, requesting_sphere: str, module_id: str, shell_quantity: int, module_quantity: int = 1
+    ) -> None:
+        """Handle incoming construction request for module_quantity modules of shell_quantity shells each."""
 
         logger.info(
-            f"Construction Sector received request from {requesting_sphere} for {module_id} ({shell_quantity} shells)"
+            f"Construction Sector received request from {requesting_sphere} for {module_quantity} x {module_id} "
+            f"({shell_quantity} shells each)"
         )
 
         # Determine equipment needed based on module_id
         equipment_type = self.EQUIPMENT_MAP.get(module_id)
-        equipment_needed = {equipment_type: 1} if equipment_type else {}
 
         try:
-            request = ConstructionRequest(
-                requesting_sphere=requesting_sphere,
-                module_id=module_id,
-                shell_quantity_needed=shell_quantity,
-                equipment_needed=equipment_needed,
-                status=ConstructionRequestStatus.QUEUED.value,
-            )
-            self.construction_queue.append(request)
+            for _ in range(module_quantity):
+                request = ConstructionRequest(
+                    requesting_sphere=requesting_sphere,
+                    module_id=module_id,
+                    shell_quantity_needed=shell_quantity,
+                    equipment_needed={equipment_type: 1} if equipment_type else {},
+                    status=ConstructionRequestStatus.QUEUED.value,
+                )
+                self.construction_queue.append(request)
         except ValueError as e:
             logger.error(f"Invalid construction request: {e}")
 
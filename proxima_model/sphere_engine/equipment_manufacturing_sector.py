@@ -132,6 +132,7 @@ class EquipmentManSector:
         self.model = model
         self.config = config
         self.event_bus = event_bus
+        self._sector_name = config.get("sector_name")
         self.sector_state = SectorState.ACTIVE
 
         # Buffer for incoming events (process next step)
@@ -162,7 +163,7 @@ class EquipmentManSector:
         return self._inventory.pending_orders.copy()
 
     def handle_payload_delivery(self, to_sector: str, payload: Dict[str, float]):
-        if to_sector == self.config.get("sector_name"):
+        if to_sector == self._sector_name:
             self._event_buffer.append(("payload_delivered", payload))
 
     def handle_equipment_request(self, requesting_sector: str, equipment_type: str, quantity: int) -> None:
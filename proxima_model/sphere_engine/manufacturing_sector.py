@@ -19,13 +19,16 @@ CORE ALGORITHMS:
 """
 
 from __future__ import annotations
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Tuple, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Optional
 from proxima_model.components.isru import ISRUAgent, ISRUMode, ISRUStatus
 from proxima_model.world_system.world_system_defs import EventType
 
-import random  # Added for probabilistic throttling
+import numpy as np
+import random
 import threading
 import logging
 
@@ -50,7 +53,7 @@ class SectorState(Enum):
     THROTTLED = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class BufferTarget:
     """Resource buffer target configuration."""
 
@@ -64,15 +67,16 @@ class BufferTarget:
             raise ValueError("Min target cannot exceed max target")
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskDefinition:
     """Definition of a manufacturing task."""
 
     task_type: TaskType
     primary_output: str = ""
+    isru_mode: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class StockFlow:
     """Represents a resource flow transaction."""
 
@@ -82,7 +86,7 @@ class StockFlow:
     allocated: Dict[str, Tuple[str, float]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ManufacturingMetrics:
     """Manufacturing sector metrics."""
 
@@ -95,7 +99,7 @@ class ManufacturingMetrics:
     metric_contributions: Dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceRequest:
     """Represents a resource request from another sector."""
 
@@ -117,9 +121,9 @@ class ManufacturingSector:
     # Default task definitions for easy expansion
     # TODO: The stocks need to be defined in world system defs since its used by different sectors
     DEFAULT_TASKS = {
-        TaskType.HE3: TaskDefinition(TaskType.HE3, "He3_kg"),
-        TaskType.WATER: TaskDefinition(TaskType.WATER, "H2O_kg"),
-        TaskType.REGOLITH: TaskDefinition(TaskType.REGOLITH, "FeTiO3_kg"),
+        TaskType.HE3: TaskDefinition(TaskType.HE3, "He3_kg", "HE3_GENERATION"),
+        TaskType.WATER: TaskDefinition(TaskType.WATER, "H2O_kg", "ICE_EXTRACTION"),
+        TaskType.REGOLITH: TaskDefinition(TaskType.REGOLITH, "FeTiO3_kg", "REGOLITH_EXTRACTION"),
     }
 
     # Default buffer targets
@@ -145,7 +149,10 @@ class ManufacturingSector:
         # Operation state
         self.sector_state = SectorState.ACTIVE
         self.robot_throttle = 0.0  # Renamed from extractor_throttle
+        self._rng = random.Random(config.get("seed"))  # Sector-local RNG, avoids the shared module-level generator
         self.pending_stock_flows: List[StockFlow] = []
+        self._flow_pool: List[StockFlow] = []  # Processed flows recycled by add_stock_flow
+        self._last_priority_tasks: Optional[List[TaskType]] = None  # None until the first assignment
 
         # Metrics tracking
         self._current_metrics = ManufacturingMetrics()
@@ -159,6 +166,9 @@ class ManufacturingSector:
             **config.get("initial_stocks", {}),
         }
 
+        # Immutable view of stocks, republished after each atomic flow update so readers don't need the lock
+        self._stocks_snapshot: Mapping[str, float] = MappingProxyType(dict(self.stocks))
+
         # Initialize buffer targets
         self.buffer_targets: Dict[str, BufferTarget] = self._initialize_buffer_targets(config)
 
@@ -168,6 +178,11 @@ class ManufacturingSector:
             **self._load_task_definitions(config),
         }
 
+        # Task -> ISRU mode lookup, resolved once so assignment doesn't rebuild it every step
+        self._task_modes: Dict[TaskType, str] = {
+            task_type: task_def.isru_mode for task_type, task_def in self.task_definitions.items() if task_def.isru_mode
+        }
+
         self._initialize_agents(config)
 
         # Change buffer to list of ResourceRequest objects
@@ -194,9 +209,12 @@ class ManufacturingSector:
         for task_config in config.get("custom_tasks", []):
             try:
                 task_type = TaskType[task_config["name"].upper()]
+                # Overrides without an ISRU mode keep the built-in one, so robots are still assigned to the task
+                default = self.DEFAULT_TASKS.get(task_type)
                 custom_tasks[task_type] = TaskDefinition(
                     task_type=task_type,
                     primary_output=task_config.get("primary_output", ""),
+                    isru_mode=task_config.get("isru_mode", default.isru_mode if default else ""),
                 )
             except (KeyError, ValueError):
                 continue  # Skip invalid tasks
@@ -213,13 +231,42 @@ class ManufacturingSector:
                 robot = ISRUAgent(self.model, agent_config)
                 self.isru_robots.append(robot)
 
+        # Metric contributions are config-fixed; resolve (metric_id, value per robot) pairs once
+        contributions_cfg = (
+            self._manufacturing_config[0].get("metric_contributions", []) if self._manufacturing_config else []
+        )
+        # TODO: Add contribution type as an enum to metrics
+        self._metric_contributions: List[Tuple[str, float]] = [
+            (contrib["metric_id"], float(contrib.get("contribution_value", 0.0)))
+            for contrib in contributions_cfg
+            if contrib.get("metric_id") and contrib.get("contribution_type") == "predefined"
+        ]
+
+        # Per-robot power demand mirrored into an array (index-aligned with isru_robots), refreshed on mode changes
+        self._robot_power_demand = np.array([robot.get_power_demand() for robot in self.isru_robots], dtype=float)
+        self._cached_power_demand = 0.0
+        self._power_demand_dirty = True  # Set whenever a robot's mode (and so its demand) changes
+
+        # Last mode sent to each robot, so assignment only issues actual transitions
+        self._last_modes: List[str] = [robot.operational_mode.value for robot in self.isru_robots]
+
+    def _set_robot_mode(self, index: int, mode: str):
+        """Set a robot's operational mode and refresh its mirrored power demand."""
+        robot = self.isru_robots[index]
+        robot.set_operational_mode(mode)
+        self._robot_power_demand[index] = robot.get_power_demand()
+        self._last_modes[index] = mode
+        self._power_demand_dirty = True
+
     def handle_resource_request(self, requesting_sector: str, resource: str, amount: float):
         """Buffer resource request events to process with stock flows."""
         with self._lock:
             try:
                 request = ResourceRequest(requesting_sector=requesting_sector, resource=resource, amount=amount)
                 self._resource_request_buffer.append(request)
-                logger.info(f"Buffered resource request: {requesting_sector} requesting {amount:.2f} kg of {resource}")
+                logger.info(
+                    "Buffered resource request: %s requesting %.2f kg of %s", requesting_sector, amount, resource
+                )
             except ValueError as e:
                 logger.error(f"Invalid resource request: {e}")
 
@@ -227,10 +274,12 @@ class ManufacturingSector:
         """Process buffered resource requests and integrate with stock flows."""
 
         with self._lock:
-            i = 0
-            while i < len(self._resource_request_buffer):
-                request = self._resource_request_buffer[i]
-                available_amount = self.stocks.get(request.resource, 0.0)
+            pending_requests: List[ResourceRequest] = []
+            # Amounts already committed this pass; stocks are only decremented in process_all_stock_flows
+            reserved: Dict[str, float] = defaultdict(float)
+
+            for request in self._resource_request_buffer:
+                available_amount = self.stocks.get(request.resource, 0.0) - reserved[request.resource]
 
                 if available_amount >= request.amount:
                     # Create a stock flow for the resource allocation
@@ -240,19 +289,26 @@ class ManufacturingSector:
                         consumed={request.resource: request.amount},
                         allocated=allocated_resources,
                     )
+                    reserved[request.resource] += request.amount
 
                     logger.info(
-                        f"Queued resource allocation: {request.amount:.2f} kg of {request.resource} to {request.requesting_sector}"
+                        "Queued resource allocation: %.2f kg of %s to %s",
+                        request.amount,
+                        request.resource,
+                        request.requesting_sector,
                     )
 
-                    del self._resource_request_buffer[i]
-
                 else:
 
                     logger.info(
-                        f"Insufficient {request.resource}: requested {request.amount:.2f} kg, available {available_amount:.2f} kg"
+                        "Insufficient %s: requested %.2f kg, available %.2f kg",
+                        request.resource,
+                        request.amount,
+                        available_amount,
                     )
-                    i += 1  # Move to next request
+                    pending_requests.append(request)  # Keep for the next step
+
+            self._resource_request_buffer = pending_requests
 
     def add_stock_flow(
         self,
@@ -263,12 +319,23 @@ class ManufacturingSector:
     ) -> None:
         """Add a stock flow transaction to pending queue."""
 
-        flow = StockFlow(
-            source_component=source_component,
-            consumed=consumed or {},
-            generated=generated or {},
-            allocated=allocated or {},
-        )
+        if self._flow_pool:
+            # Reuse a processed flow (its dicts were cleared when it was returned to the pool)
+            flow = self._flow_pool.pop()
+            flow.source_component = source_component
+            if consumed:
+                flow.consumed.update(consumed)
+            if generated:
+                flow.generated.update(generated)
+            if allocated:
+                flow.allocated.update(allocated)
+        else:
+            flow = StockFlow(
+                source_component=source_component,
+                consumed=dict(consumed) if consumed else {},
+                generated=dict(generated) if generated else {},
+                allocated=dict(allocated) if allocated else {},
+            )
 
         self.pending_stock_flows.append(flow)
 
@@ -279,41 +346,74 @@ class ManufacturingSector:
             if not self.pending_stock_flows:
                 return {"consumed": {}, "generated": {}, "allocated": {}}
 
-            total_consumed = {}
-            total_generated = {}
-            total_allocated = {}
+            total_consumed: Dict[str, float] = defaultdict(float)
+            total_generated: Dict[str, float] = defaultdict(float)
+            total_allocated: Dict[str, float] = defaultdict(float)
+            allocations: List[Tuple[str, str, float]] = []  # (recipient_sector, resource, amount)
 
-            # Process all flows atomically
+            # Pass 1: aggregate flows per resource, returning each processed flow to the pool
             for flow in self.pending_stock_flows:
-                # Apply consumption
                 for resource, amount in flow.consumed.items():
                     if resource in self.stocks:
-                        self.stocks[resource] = max(0.0, self.stocks[resource] - amount)
-                        total_consumed[resource] = total_consumed.get(resource, 0.0) + amount
+                        total_consumed[resource] += amount
 
-                # Apply generation
                 for resource, amount in flow.generated.items():
-                    self.stocks[resource] = self.stocks.get(resource, 0.0) + amount
-                    total_generated[resource] = total_generated.get(resource, 0.0) + amount
+                    total_generated[resource] += amount
 
-                # Process resource allocations and publish events
+                # Collect resource allocations; events are published once after stocks are updated
                 for resource, (recipient_sector, amount) in flow.allocated.items():
-                    total_allocated[resource] = total_allocated.get(resource, 0.0) + amount
-
-                    # Publish the allocation event
-                    self.event_bus.publish(
-                        EventType.RESOURCE_ALLOCATED.value,
-                        recipient_sector=recipient_sector,
-                        resource=resource,
-                        amount=amount,
-                    )
-                    logger.info(
-                        f"Allocated {amount:.2f} kg of {resource} to {recipient_sector}. Remaining: {self.stocks[resource]:.2f} kg"
-                    )
+                    total_allocated[resource] += amount
+                    allocations.append((recipient_sector, resource, amount))
+
+                flow.consumed.clear()
+                flow.generated.clear()
+                flow.allocated.clear()
+                self._flow_pool.append(flow)
 
-            # Clear processed flows
+            # Pass 2: apply each resource's net change once
+            for resource, amount in total_generated.items():
+                self.stocks[resource] = self.stocks.get(resource, 0.0) + amount
+            for resource, amount in total_consumed.items():
+                self.stocks[resource] = max(0.0, self.stocks[resource] - amount)
+
+            # Publish the new stock levels
             self.pending_stock_flows.clear()
-            return {"consumed": total_consumed, "generated": total_generated, "allocated": total_allocated}
+            self._stocks_snapshot = MappingProxyType(dict(self.stocks))
+
+            if allocations:
+                self._publish_allocations(allocations)
+
+            return {
+                "consumed": dict(total_consumed),
+                "generated": dict(total_generated),
+                "allocated": dict(total_allocated),
+            }
+
+    def _publish_allocations(self, allocations: List[Tuple[str, str, float]]):
+        """Publish this step's resource allocations as a single batch event."""
+
+        self.event_bus.publish(EventType.RESOURCE_ALLOCATED_BATCH.value, allocations=allocations)
+
+        # Compatibility: re-emit per-allocation events only when a subscriber still listens for them
+        if self.event_bus.get_subscriber_count(EventType.RESOURCE_ALLOCATED.value):
+            for recipient_sector, resource, amount in allocations:
+                self.event_bus.publish(
+                    EventType.RESOURCE_ALLOCATED.value,
+                    recipient_sector=recipient_sector,
+                    resource=resource,
+                    amount=amount,
+                )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for recipient_sector, resource, amount in allocations:
+                logger.debug(
+                    "Allocated %.2f kg of %s to %s. Remaining: %.2f kg",
+                    amount,
+                    resource,
+                    recipient_sector,
+                    self.stocks[resource],
+                )
+        logger.info("Allocated %d resource requests this step", len(allocations))
 
     def _calculate_task_priorities(self) -> List[TaskType]:
         """Calculate task priorities based on resource deficiencies."""
@@ -340,30 +440,20 @@ class ManufacturingSector:
     def _assign_agents_to_tasks(self, priority_tasks: List[TaskType]):
         """Assign ISRU robots to tasks based on priority."""
 
-        # Set all robots to inactive first
-        for robot in self.isru_robots:
-            robot.set_operational_mode("INACTIVE")
+        # Robots take priority task modes in order (tasks without an ISRU mode are skipped); the rest go inactive
+        assignable_modes = [self._task_modes[task] for task in priority_tasks if task in self._task_modes]
+        assigned_count = len(assignable_modes)
 
-        # Assign robots to priority tasks
-        robot_index = 0
-        for task_type in priority_tasks:
-            # Direct mapping from task type to ISRU mode (hardcoded for simplicity)
-            # TODO: This needs to be not hard coded
-            mode_mapping = {
-                TaskType.HE3: "HE3_GENERATION",
-                TaskType.WATER: "ICE_EXTRACTION",
-                TaskType.REGOLITH: "REGOLITH_EXTRACTION",
-            }
-
-            if task_type in mode_mapping and robot_index < len(self.isru_robots):
-                mode = mode_mapping[task_type]
-                self.isru_robots[robot_index].set_operational_mode(mode)
-                robot_index += 1
+        # Only robots whose target mode differs from the last one sent need a transition
+        for index, last_mode in enumerate(self._last_modes):
+            mode = assignable_modes[index] if index < assigned_count else "INACTIVE"
+            if mode != last_mode:
+                self._set_robot_mode(index, mode)
 
     def set_throttle_factor(self, throttle_value: float):
         """Set throttle factor for robot operations (0.0 to 1.0)."""
         self.robot_throttle = max(0.0, min(1.0, throttle_value))  # Clamp to 0-1
-        logger.info(f"Manufacturing sector throttle factor set to: {self.robot_throttle}")
+        logger.info("Manufacturing sector throttle factor set to: %s", self.robot_throttle)
 
     def get_power_demand(self) -> float:
         """Calculate total power demand from all ISRU operations."""
@@ -371,7 +461,11 @@ class ManufacturingSector:
         if self.sector_state == SectorState.INACTIVE:
             return 0.0
 
-        return sum(robot.get_power_demand() for robot in self.isru_robots)
+        if self._power_demand_dirty:
+            self._cached_power_demand = float(self._robot_power_demand.sum())
+            self._power_demand_dirty = False
+
+        return self._cached_power_demand
 
     def step(self, allocated_power: float) -> float:
         """Execute manufacturing operations for one simulation step."""
@@ -385,36 +479,73 @@ class ManufacturingSector:
             self._set_all_agents_inactive()
             return allocated_power
 
-        # Determine task priorities and assign agents
+        # Determine task priorities; robot assignment only needs to change when the priority order does
         priority_tasks = self._calculate_task_priorities()
-        self._assign_agents_to_tasks(priority_tasks)
-
-        remaining_power = allocated_power
+        if priority_tasks != self._last_priority_tasks:
+            if priority_tasks:
+                self._assign_agents_to_tasks(priority_tasks)
+            else:
+                self._set_all_agents_inactive()
+            self._last_priority_tasks = priority_tasks
+
+        robot_count = len(self.isru_robots)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        # Probabilistic throttling: skip robot with probability = robot_throttle
+        draw, throttle = self._rng.random, self.robot_throttle
+        throttled = np.fromiter((draw() < throttle for _ in range(robot_count)), dtype=bool, count=robot_count)
+        demands = np.where(throttled, 0.0, self._robot_power_demand)
+
+        # Greedy in-order power allocation: every robot before the cutoff fits in the budget, so the head is
+        # charged in one subtraction and only robots past the cutoff need individual budget checks
+        demand_cumsum = np.cumsum(demands)
+        cutoff = int(np.searchsorted(demand_cumsum, allocated_power, side="right"))
+        remaining_power = allocated_power - float(demand_cumsum[cutoff - 1]) if cutoff else allocated_power
+
+        # Loop-invariant lookups bound once; per-robot values are read from plain lists, not NumPy scalars
+        metrics = self._current_metrics
+        stocks = self.stocks
+        add_stock_flow = self.add_stock_flow
+        status_throttled, status_inactive = ISRUStatus.THROTTLED, ISRUStatus.INACTIVE
+        throttled_list = throttled.tolist()
+        demand_list = demands.tolist()
+
+        # Execute ISRU robot operations
+        for index, robot in enumerate(self.isru_robots):
+
+            if throttled_list[index]:
+                robot.status = status_throttled
+                if debug_enabled:
+                    logger.debug("Robot: THROTTLED (skipped this step)")
+                continue
 
-        # Execute ISRU robot operations with probabilistic throttling
-        for robot in self.isru_robots:
+            power_demand = demand_list[index]
+            if power_demand == 0:
+                # Idle robots keep their INACTIVE mode across steps; make sure a stale status doesn't linger
+                robot.status = status_inactive
+                continue
 
-            # Probabilistic throttling: skip robot with probability = robot_throttle
-            if random.random() < self.robot_throttle:
-                robot.status = ISRUStatus.THROTTLED
-                logger.debug(f"Robot: THROTTLED (skipped this step)")
+            in_head = index < cutoff
+            if not in_head and remaining_power < power_demand:
+                # Doesn't fit the budget this step; clear any status left over from an earlier step
+                robot.status = status_inactive
                 continue
 
-            power_demand = robot.get_power_demand()
-            if power_demand > 0 and remaining_power >= power_demand:
-                generated, consumed, used_power = robot.perform_operation(power_demand, self.stocks)
+            generated, consumed, used_power = robot.perform_operation(power_demand, stocks)
 
-                if generated or consumed:
-                    self.add_stock_flow("ISRU_Robot", consumed, generated)
+            if generated or consumed:
+                add_stock_flow("ISRU_Robot", consumed, generated)
 
+            if not in_head:
                 remaining_power -= used_power
-                self._current_metrics.power_consumed += used_power
+            metrics.power_consumed += used_power
 
-                if used_power > 0:
-                    self._current_metrics.operational_robots += 1
-                    logger.debug(f"Robot: OPERATIONAL - used {used_power:.2f} kW")
-                else:
-                    robot.status = ISRUStatus.INACTIVE
+            if used_power > 0:
+                metrics.operational_robots += 1
+                if debug_enabled:
+                    logger.debug("Robot: OPERATIONAL - used %.2f kW", used_power)
+            else:
+                robot.status = status_inactive
 
         # Process all stock flows atomically
         self.process_all_stock_flows()
@@ -428,12 +559,20 @@ class ManufacturingSector:
         """Set all agents to inactive mode."""
         for robot in self.isru_robots:
             robot.set_operational_mode("INACTIVE")
+        self._robot_power_demand.fill(0.0)
+        self._power_demand_dirty = True
+        self._last_modes = ["INACTIVE"] * len(self.isru_robots)
+        self._last_priority_tasks = []
 
-    def get_stocks(self) -> Dict[str, float]:
-        """Return current resource stocks (read-only copy)."""
+    def get_stocks(self) -> Mapping[str, float]:
+        """
+        Return current resource stocks as a read-only snapshot.
 
-        with self._lock:
-            return self.stocks.copy()
+        The snapshot is replaced (never mutated) after each atomic flow update, so it is safe to read
+        without locking. Callers that need to modify the result should copy it with dict().
+        """
+
+        return self._stocks_snapshot
 
     def set_buffer_targets(self, targets: Dict[str, Dict[str, float]]):
         """Update buffer targets dynamically."""
@@ -453,21 +592,8 @@ class ManufacturingSector:
             dict: A dictionary where keys are metric IDs and values are their contributions.
         """
 
-        metric_map = {}
-        contributions_cfg = self._manufacturing_config[0].get("metric_contributions", [])
-
-        for contrib in contributions_cfg:
-
-            metric_id = contrib.get("metric_id")
-            value = float(contrib.get("contribution_value", 0.0))
-            contribution_type = contrib.get("contribution_type")
-
-            # TODO: Add contribution type as an enum to metrics
-            if metric_id and contribution_type == "predefined":
-                operational_count = sum(1 for r in self.isru_robots if r.status == ISRUStatus.OPERATIONAL)
-                metric_map[metric_id] = operational_count * value
-
-        return metric_map
+        operational_count = self._current_metrics.operational_robots
+        return {metric_id: operational_count * value for metric_id, value in self._metric_contributions}
 
     def get_metrics(self) -> Dict:
         """Return comprehensive manufacturing sector metrics."""
@@ -5,15 +5,111 @@ Manages all science-related activities in the Proxima simulation.
 Handles science rovers, research operations, and power management.
 """
 
-from proxima_model.components.science_rover import ScienceRover, RoverStatus
+from proxima_model.components.science_rover import ScienceRover
 from proxima_model.world_system.world_system_defs import EventType
+from proxima_model.sphere_engine._science_batch import step_all
 
-import random
+from dataclasses import dataclass, field
+from typing import Tuple
+
+import numpy as np
 import logging
 import math
+import sys
+import weakref
 
 logger_science = logging.getLogger(__name__)
 
+SCIENCE_ROVER_MODULE_ID = sys.intern("comp_science_rover")
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class _RoverSpec:
+    """Parsed fields of one science rover config block."""
+
+    source: dict = field(compare=False, repr=False)  # The parsed block; keeps its id from being reused
+    quantity: int
+    science_generation: float
+    metric_contributions: Tuple[Tuple[str, float], ...]
+
+
+# Parsed rover specs shared across sectors, keyed by config block identity. Entries live only while some sector
+# holds the spec, so the cache doesn't grow across models and replicas. Config blocks are treated as read-only.
+_ROVER_SPEC_CACHE: "weakref.WeakValueDictionary[int, _RoverSpec]" = weakref.WeakValueDictionary()
+
+
+def _rover_spec(rover_config: dict) -> _RoverSpec:
+    """Return the parsed spec for a rover config block, parsing it on first use."""
+
+    spec = _ROVER_SPEC_CACHE.get(id(rover_config))
+    if spec is not None and spec.source is rover_config:
+        return spec
+
+    spec = _RoverSpec(
+        source=rover_config,
+        quantity=int(rover_config.get("quantity", 1)),
+        science_generation=float(rover_config.get("science_generation", 0.5)),
+        metric_contributions=tuple(
+            (contrib["metric_id"], float(contrib.get("contribution_value", 0.0)))
+            for contrib in rover_config.get("metric_contributions", [])
+            if contrib.get("metric_id") and contrib.get("contribution_type") == "predefined"
+        ),
+    )
+    _ROVER_SPEC_CACHE[id(rover_config)] = spec
+    return spec
+
+
+# ScienceSector attributes holding per-rover state, index-aligned with science_rovers
+_FLEET_ARRAYS = (
+    "rover_ids",
+    "rover_battery_kWh",
+    "rover_battery_capacity_kWh",
+    "rover_power_usage_kWh",
+    "rover_science_generation",
+    "rover_science_buffer",
+    "rover_status",
+)
+
+
+def _growth_rate(S_0: float, S_current: float, t_elapsed: float) -> float:
+    """Growth rate r solving S_current = S_0 * 2^(r * t_elapsed); 0.0 when undefined."""
+
+    # Avoid division by zero or negative rates
+    if S_0 <= 0 or S_current <= 0 or t_elapsed <= 0:
+        return 0.0
+    return math.log2(S_current / S_0) / t_elapsed
+
+
+def _rover_order(
+    S_target: float,
+    p_eff: float,
+    R_active: int,
+    expected_losses: int,
+    in_pipeline: int,
+    max_pipeline: int,
+    safety_factor: float,
+) -> Tuple[int, int, int, int]:
+    """
+    Rover ordering steps of the growth algorithm. safety_factor is the order multiplier (1+β).
+
+    Returns:
+        (R_req, R_fore, q, q_capped): required rovers, forecast rovers, order quantity and the quantity that
+        fits in the pipeline.
+    """
+
+    # Step 3: Calculate required rovers R_req = ceil(S_target / p_eff)
+    R_req = math.ceil(S_target / p_eff) if p_eff > 0 else 0
+
+    # Step 4: Forecast available rovers R_fore = R_active - Losses + pipeline
+    R_fore = max(0, R_active - expected_losses + in_pipeline)
+
+    # Step 5: Calculate order quantity q(t) = max(0, ceil((1+β)*R_req) - R_fore)
+    q = max(0, math.ceil(safety_factor * R_req) - R_fore)
+
+    # Step 6: Apply pipeline capacity constraint
+    q_capped = min(q, max_pipeline - in_pipeline)
+    return R_req, R_fore, q, q_capped
+
 
 class ScienceSector:
     """Manages science rovers and research operations."""
@@ -31,21 +127,45 @@ class ScienceSector:
         self.model = model
         self.config = config
         self.event_bus = event_bus
+        self._sector_name = sys.intern(config.get("sector_name") or "")
         self.science_rovers = []
         self.total_science_cumulative = 0.0
         self.throttle_factor = 0.0  # 0.0 = no throttling, 1.0 = always throttled
+        self._rng = np.random.default_rng(config.get("seed"))  # Throttling draws; seed for reproducible runs
+        self._rover_power_demand = 0.0  # Charging demand, kept current as rovers are created and stepped
+
+        # Rover fleet state as a structure of arrays (index-aligned with science_rovers). The arrays are the
+        # source of truth: each ScienceRover is bound to them and reads its state through them.
+        self.rover_ids = np.zeros(0, dtype=np.int32)
+        self.rover_battery_kWh = np.zeros(0)
+        self.rover_battery_capacity_kWh = np.zeros(0)
+        self.rover_power_usage_kWh = np.zeros(0)
+        self.rover_science_generation = np.zeros(0)
+        self.rover_science_buffer = np.zeros(0)
+        self.rover_status = np.zeros(0, dtype=np.int8)
+        self._operational_count = 0  # Cached count of OPERATIONAL rovers, refreshed in step()
 
         # Growth rate tracking - always measured over growth duration
         self.current_growth_rate = 0.0  # Growth rate r in S(t) = S_0 * 2^(r*t)
         self.S_0 = 0.0  # Science production rate at the start of the growth duration window
-        self.science_history = []  # Store (month, science_rate) tuples
 
         # Growth policy parameters (from science_policies.md)
         self.growth_duration_sp = 1
+        self.growth_rate_sp = None  # Set by control_science_growth_rate
+        # "step" re-runs the growth algorithm on every policy call; "event" only when the policy changes or a
+        # rover is delivered
+        self.growth_update_mode = self.config.get("growth_update_mode", "step")
+        self._growth_inputs_changed = True
+        self._target_growth_factor = None  # t -> S_target / S_0 for the current policy, see _specialize_growth_target
         self.lead_time_L = 1  # Expected lead time for rover deployment (months) - used for forecasting
         self.planning_horizon_H = 60  # Planning horizon (typically = lead time)
         self.safety_margin_beta = 0.1  # Safety margin fraction (10%)
 
+        # Science history ring buffer of (month, science_rate) rows, sized to 2x the growth duration
+        self._history = np.zeros((2 * self.growth_duration_sp, 2))
+        self._history_head = 0  # Row the next entry is written to
+        self._history_len = 0
+
         # Pipeline tracking - just track total count of rovers on order
         self.rovers_in_pipeline = 0  # Total number of rovers currently being built/shipped
         self.max_pipeline_capacity = 10  # Maximum rovers that can be in pipeline at once
@@ -55,6 +175,7 @@ class ScienceSector:
         self.nominal_productivity_p = 0.0  # Will be calculated from config (science_generation)
         self.availability_factor_a = 1.0  # Reliability factor (1.0 = perfect reliability)
         self.utilization_factor_u = 1.0  # Utilization factor (power/crew/comms limitations)
+        self._p_eff = 0.0  # Effective productivity p * a * u, updated with a and u by the growth algorithm
 
         # Event Subscribtions
         self.event_bus.subscribe(EventType.MODULE_COMPLETED.value, self.handle_module_completed)
@@ -65,31 +186,58 @@ class ScienceSector:
 
         self.rover_configs = self.config.get("science_rovers", [])
         self.rover_id_counter = 0
-        self.nominal_productivity_p = self.rover_configs[0].get("science_generation", 0.5)
+        specs = self._rover_specs = [_rover_spec(agent_config) for agent_config in self.rover_configs]
+        self.nominal_productivity_p = specs[0].science_generation
+        self._p_eff = self.nominal_productivity_p * self.availability_factor_a * self.utilization_factor_u
 
-        for agent_config in self.rover_configs:
-            quantity = agent_config.get("quantity", 1)
-            for _ in range(quantity):
+        # Contributions from the first rover config (assumed to be the same for all)
+        self._metric_contributions = specs[0].metric_contributions
+
+        # Size the fleet arrays for every configured rover up front, then fill them slot by slot
+        self._grow_fleet_arrays(sum(spec.quantity for spec in specs))
+        for agent_config, spec in zip(self.rover_configs, specs):
+            for _ in range(spec.quantity):
                 self._create_rover(agent_config)
 
+    def _grow_fleet_arrays(self, extra: int):
+        """Append extra zeroed slots to every fleet array."""
+
+        for name in _FLEET_ARRAYS:
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate((array, np.zeros(extra, dtype=array.dtype))))
+
     def _create_rover(self, rover_config):
         """Create a single science rover."""
 
-        unique_id = f"science_rover_{self.rover_id_counter}"
-        rover = ScienceRover(unique_id, self.model, rover_config)
+        rover = ScienceRover(self.rover_id_counter, self.model, rover_config)
+        index = len(self.science_rovers)
         self.science_rovers.append(rover)
+
+        # Rovers added after initialization (e.g. newly built ones) need a new slot
+        if index == len(self.rover_ids):
+            self._grow_fleet_arrays(1)
+
+        # Fill the rover's slot and move its state into the fleet arrays
+        self.rover_ids[index] = self.rover_id_counter
+        self.rover_battery_capacity_kWh[index] = rover.battery_capacity_kWh
+        self.rover_power_usage_kWh[index] = rover.power_usage_kWh
+        self.rover_science_generation[index] = rover.science_generation
+        rover.bind(self, index)
+
+        self._rover_power_demand += rover.get_power_demand()
         self.rover_id_counter += 1
-        logger_science.info(f"Created {unique_id}")
+        if logger_science.isEnabledFor(logging.INFO):
+            logger_science.info("Created %s", rover.unique_id)
         return rover
 
     def handle_module_completed(self, requesting_sphere: str, module_id: str, **kwargs):
         """Handle newly constructed modules."""
 
         # Only process if it's for us and it's a science rover
-        if requesting_sphere != self.config.get("sector_name"):
+        if requesting_sphere != self._sector_name:
             return
 
-        if module_id != "comp_science_rover":
+        if module_id != SCIENCE_ROVER_MODULE_ID:
             return
 
         # Get base config from our existing rovers
@@ -99,37 +247,40 @@ class ScienceSector:
 
         base_config = self.rover_configs[0]
         new_rover = self._create_rover(base_config)
+        self._growth_inputs_changed = True
 
         # Decrement pipeline count
         if self.rovers_in_pipeline > 0:
             self.rovers_in_pipeline -= 1
             logger_science.info(
-                f"✅ Added new science rover: {new_rover.unique_id} "
-                f"(total: {len(self.science_rovers)}, pipeline: {self.rovers_in_pipeline})"
+                "Added new science rover: %s (total: %d, pipeline: %d)",
+                new_rover.unique_id,
+                len(self.science_rovers),
+                self.rovers_in_pipeline,
             )
         else:
             logger_science.info(
-                f"✅ Added new science rover: {new_rover.unique_id} "
-                f"(total: {len(self.science_rovers)}) - not from pipeline order"
+                "Added new science rover: %s (total: %d) - not from pipeline order",
+                new_rover.unique_id,
+                len(self.science_rovers),
             )
 
     def set_throttle_factor(self, throttle_value: float):
         """Set throttle factor for probabilistic rover operation (0.0 to 1.0)."""
 
-        self.throttle_factor = max(0.0, min(1.0, throttle_value))  # Clamp to 0-1
+        throttle_factor = max(0.0, min(1.0, throttle_value))  # Clamp to 0-1
+        if throttle_factor != self.throttle_factor:
+            self.throttle_factor = throttle_factor
+            self._growth_inputs_changed = True  # Utilization (and so p_eff) depends on the throttle
 
     def get_power_demand(self) -> float:
         """
         Calculate total power demand from all rovers that need to charge.
         A rover needs to charge if it cannot operate in the next step.
+        Rover batteries only change in step(), so the demand is accumulated there.
         """
 
-        power_demand = 0.0
-        for rover in self.science_rovers:
-            if rover.current_battery_kWh < rover.power_usage_kWh:
-                power_demand += rover.battery_capacity_kWh - rover.current_battery_kWh
-
-        return power_demand
+        return self._rover_power_demand
 
     def control_science_growth_rate(self, growth_rate: float, growth_duration: int):
         """
@@ -139,16 +290,68 @@ class ScienceSector:
             growth_rate: Target growth rate (1/doubling_months)
             growth_duration: Duration over which to measure growth (months)
         """
+        if growth_duration != self.growth_duration_sp:
+            self._resize_history(2 * growth_duration)
+        policy_changed = growth_rate != self.growth_rate_sp or growth_duration != self.growth_duration_sp
         self.growth_duration_sp = growth_duration  # Steps
         self.growth_rate_sp = growth_rate
-        self._apply_growth_algorithm(self.model.steps)
+        if policy_changed:
+            self._specialize_growth_target()
+            self._growth_inputs_changed = True
+
+        if self.growth_update_mode == "step" or self._growth_inputs_changed:
+            self._apply_growth_algorithm(self.model.steps)
+            self._growth_inputs_changed = False
 
         logger_science.info(
-            f"Science Sector Policy Applied - "
-            f"Target: growth rate {self.growth_rate_sp:.2f}, "
-            f"Growth duration: {growth_duration} steps"
+            "Science Sector Policy Applied - Target: growth rate %.2f, Growth duration: %s steps",
+            self.growth_rate_sp,
+            growth_duration,
         )
 
+    def _specialize_growth_target(self):
+        """
+        Build the growth factor S_target(t+H) / S_0 = growth_rate^((t+H)/growth_duration) for the current policy.
+
+        The policy parameters and planning horizon are bound into the closure, so the per-step call is a single
+        exp. Rebuilt by control_science_growth_rate whenever the policy changes.
+        """
+
+        growth_rate, duration, H = self.growth_rate_sp, self.growth_duration_sp, self.planning_horizon_H
+
+        if growth_rate > 0:
+            # growth_rate ** (x / duration) == exp(x * ln(growth_rate) / duration)
+            log_rate = math.log(growth_rate) / duration
+
+            def target_growth_factor(t):
+                return math.exp(log_rate * (t + H))
+
+        else:
+
+            def target_growth_factor(t):
+                return growth_rate ** ((t + H) / duration)
+
+        self._target_growth_factor = target_growth_factor
+
+    @property
+    def science_history(self) -> list:
+        """Science history as a list of (month, science_rate) tuples, oldest first."""
+        return [tuple(row) for row in self._ordered_history().tolist()]
+
+    def _ordered_history(self) -> np.ndarray:
+        """Return the valid ring buffer rows in chronological order."""
+        start = self._history_head - self._history_len
+        return np.take(self._history, np.arange(start, self._history_head), axis=0, mode="wrap")
+
+    def _resize_history(self, capacity: int):
+        """Resize the science history ring buffer, keeping the most recent entries that fit."""
+        capacity = max(2, capacity)
+        recent = self._ordered_history()[-capacity:]
+        self._history = np.zeros((capacity, 2))
+        self._history[: len(recent)] = recent
+        self._history_len = len(recent)
+        self._history_head = self._history_len % capacity
+
     def _calculate_growth_rate(self):
         """
         Calculate the current growth rate over the configured duration.
@@ -160,39 +363,26 @@ class ScienceSector:
             S_0 = science production at the start of the growth duration window
         """
 
-        if len(self.science_history) < 2:
+        if self._history_len < 2:
             # Not enough data yet
             self.current_growth_rate = 0.0
             self.S_0 = self.step_science_generated if hasattr(self, "step_science_generated") else 0.0
             return
 
         # Get measurements from growth rate duration setpoint
-        window_start = max(0, len(self.science_history) - self.growth_duration_sp)
-        start_month, S_0_new = self.science_history[window_start]
-        current_month, S_current = self.science_history[-1]
+        capacity = len(self._history)
+        window_start = max(0, self._history_len - self.growth_duration_sp)
+        start_month, S_0_new = self._history[
+            (self._history_head - self._history_len + window_start) % capacity
+        ].tolist()
+        current_month, S_current = self._history[(self._history_head - 1) % capacity].tolist()
 
         # Update S_0 to the science rate at the start of the window
         self.S_0 = S_0_new
 
-        # Avoid division by zero or negative rates
-        if self.S_0 <= 0 or S_current <= 0:
-            self.current_growth_rate = 0.0
-            return
-
-        # Calculate actual time elapsed
-        t_elapsed = current_month - start_month
-        if t_elapsed <= 0:
-            self.current_growth_rate = 0.0
-            return
-
-        # From S(t) = S_0 * 2^(r*t), solve for r:
+        # From S(t) = S_0 * 2^(r*t), solve for r over the actual time elapsed:
         # r = log2(S_current / S_0) / t_elapsed
-        growth_ratio = S_current / self.S_0
-        if growth_ratio <= 0:
-            self.current_growth_rate = 0.0
-            return
-
-        self.current_growth_rate = math.log2(growth_ratio) / t_elapsed
+        self.current_growth_rate = _growth_rate(self.S_0, S_current, current_month - start_month)
 
     def _apply_growth_algorithm(self, t: int):
         """
@@ -210,59 +400,54 @@ class ScienceSector:
             t: Current time (month)
         """
 
-        # Step 1: Calculate effective productivity p_eff = p * a * u
-        operational_count = sum(1 for r in self.science_rovers if r.status == RoverStatus.OPERATIONAL)
-        if len(self.science_rovers) > 0:
-            self.availability_factor_a = operational_count / len(self.science_rovers)
-        else:
-            self.availability_factor_a = 1.0
-
+        # Step 1: Calculate effective productivity p_eff = p * a * u (availability a is updated by step)
+        operational_count = self._operational_count
         self.utilization_factor_u = 1.0 - self.throttle_factor
         p_eff = self.nominal_productivity_p * self.availability_factor_a * self.utilization_factor_u
+        self._p_eff = p_eff
 
         # Step 2: Calculate target science rate at horizon S_target(t+H)
         if self.S_0 <= 0:
             # Use current rate if S_0 not established yet
             self.S_0 = self.step_science_generated
 
-        S_target = self.S_0 * (self.growth_rate_sp ** ((t + self.planning_horizon_H) / self.growth_duration_sp))
+        S_target = self.S_0 * self._target_growth_factor(t)
 
-        # Step 3: Calculate required rovers R_req = ceil(S_target / p_eff)
-        if p_eff > 0:
-            R_req = math.ceil(S_target / p_eff)
-        else:
-            R_req = 0
-
-        # Step 4: Forecast available rovers R_fore = R_active - Losses + pipeline
+        # Steps 3-6: Required rovers, forecast, order quantity and pipeline capacity constraint
         R_active = operational_count
-        R_fore = R_active - self.expected_losses + self.rovers_in_pipeline
-        R_fore = max(0, R_fore)
-
-        # Step 5: Calculate order quantity q(t) = max(0, ceil((1+β)*R_req) - R_fore)
-        q = max(0, math.ceil((1 + self.safety_margin_beta) * R_req) - R_fore)
-
-        # Step 6: Apply pipeline capacity constraint
-        available_pipeline_capacity = self.max_pipeline_capacity - self.rovers_in_pipeline
-        q_capped = min(q, available_pipeline_capacity)
+        R_req, R_fore, q, q_capped = _rover_order(
+            S_target,
+            p_eff,
+            R_active,
+            self.expected_losses,
+            self.rovers_in_pipeline,
+            self.max_pipeline_capacity,
+            1.0 + self.safety_margin_beta,
+        )
 
         if q_capped < q:
             logger_science.warning(
-                f"Pipeline capacity constraint: requested {q} rovers, "
-                f"but only {q_capped} can be ordered "
-                f"(pipeline: {self.rovers_in_pipeline}/{self.max_pipeline_capacity})"
+                "Pipeline capacity constraint: requested %d rovers, but only %d can be ordered (pipeline: %d/%d)",
+                q,
+                q_capped,
+                self.rovers_in_pipeline,
+                self.max_pipeline_capacity,
             )
 
         logger_science.info(
-            f"Growth Algorithm (t={t}): "
-            f"S_0={self.S_0:.2f}, "
-            f"S_target={S_target:.2f}, "
-            f"p_eff={p_eff:.3f}, "
-            f"R_req={R_req}, "
-            f"R_active={R_active}, "
-            f"pipeline={self.rovers_in_pipeline}/{self.max_pipeline_capacity}, "
-            f"R_fore={R_fore}, "
-            f"order_requested={q}, "
-            f"order_actual={q_capped}"
+            "Growth Algorithm (t=%s): S_0=%.2f, S_target=%.2f, p_eff=%.3f, R_req=%s, R_active=%s, "
+            "pipeline=%d/%d, R_fore=%s, order_requested=%s, order_actual=%s",
+            t,
+            self.S_0,
+            S_target,
+            p_eff,
+            R_req,
+            R_active,
+            self.rovers_in_pipeline,
+            self.max_pipeline_capacity,
+            R_fore,
+            q,
+            q_capped,
         )
 
         # Step 7: Place order if needed
@@ -270,65 +455,51 @@ class ScienceSector:
             self.rovers_in_pipeline += q_capped
 
             logger_science.info(
-                f"📦 Ordering {q_capped} rovers "
-                f"(expected delivery: ~month {t + self.lead_time_L}, "
-                f"total in pipeline: {self.rovers_in_pipeline}/{self.max_pipeline_capacity})"
+                "Ordering %d rovers (expected delivery: ~month %s, total in pipeline: %d/%d)",
+                q_capped,
+                t + self.lead_time_L,
+                self.rovers_in_pipeline,
+                self.max_pipeline_capacity,
             )
 
-            # Send event to logistics/manufacturing sector
-            # TODO: Need to send request per item in the pipeline otherwise the algorithm wont be accurate
+            # Send one event to the construction sector covering every rover in this order
             self.event_bus.publish(
                 EventType.CONSTRUCTION_REQUEST.value,
-                requesting_sphere=self.config.get("sector_name"),
-                module_id="comp_science_rover",
+                requesting_sphere=self._sector_name,
+                module_id=SCIENCE_ROVER_MODULE_ID,
                 shell_quantity=1,
+                module_quantity=q_capped,
             )
 
     def step(self, available_power: float):
         """
         Execute one simulation step for the science sector.
         Distributes available power to rovers and collects generated science.
+        The fleet is stepped through step_all, which can also step several sectors together.
         """
 
-        self.step_science_generated = 0.0
-        total_power_used = 0.0
-        remaining_power = available_power
-
-        # Calculate power per rover (optional: distribute evenly)
-        power_per_rover = remaining_power / len(self.science_rovers) if self.science_rovers else 0.0
-
-        # Update each rover
-        for i, rover in enumerate(self.science_rovers):
-            # Probabilistic throttling: skip rover with probability = throttle_factor
-            if random.random() < self.throttle_factor:
-                # Rover is throttled - skip its step
-                power_used = 0.0
-                science_generated = 0.0
-                rover.status = RoverStatus.THROTTLED
-            else:
-                # Rover operates normally - give it its share of power
-                rover.status = RoverStatus.OPERATIONAL
-                rover_power = min(power_per_rover, remaining_power)
-                power_used, science_generated = rover.step(rover_power)
-                remaining_power = max(0.0, remaining_power - power_used)
-
-            total_power_used += power_used
-            self.step_science_generated += science_generated
+        return step_all([self], [available_power])[0]
+
+    def _record_step(self, science_generated: float):
+        """Record the science generated by the rover fleet this step and update the growth rate."""
+
+        self.step_science_generated = science_generated
+
+        # Fleet availability from this step's operational count
+        rover_count = len(self.science_rovers)
+        self.availability_factor_a = self._operational_count / rover_count if rover_count > 0 else 1.0
 
         # Update cumulative science
         self.total_science_cumulative += self.step_science_generated
 
-        # Track science production rate history
-        self.science_history.append((self.model.steps, self.step_science_generated))
-
-        # Keep only the 2x the measurement window to avoid unbounded growth
-        max_history_length = self.growth_duration_sp * 2
-        if len(self.science_history) > max_history_length:
-            self.science_history = self.science_history[-max_history_length:]
+        # Track science production rate history; the ring buffer keeps only the 2x the measurement window
+        capacity = len(self._history)
+        self._history[self._history_head] = (self.model.steps, self.step_science_generated)
+        self._history_head = (self._history_head + 1) % capacity
+        self._history_len = min(self._history_len + 1, capacity)
 
         # Calculate current growth rate (updates both current_growth_rate and S_0)
         self._calculate_growth_rate()
-        return total_power_used, self.step_science_generated
 
     def _create_metric_map(self) -> dict:
         """
@@ -336,34 +507,18 @@ class ScienceSector:
         This includes contributions from operational rovers and direct sector outputs.
         """
 
-        metric_map = {}
-
-        # 1. Calculate contributions based on operational agents from config
-        if self.rover_configs:
-
-            # Get the list of contributions from the first rover config (assumed to be the same for all)
-            contributions_cfg = self.rover_configs[0].get("metric_contributions", [])
-            # Count rovers that are currently operational (not throttled)
-            operational_count = sum(1 for r in self.science_rovers if r.status == RoverStatus.OPERATIONAL)
-
-            for contrib in contributions_cfg:
-                metric_id = contrib.get("metric_id")
-                value_per_agent = float(contrib.get("contribution_value", 0.0))
-                contribution_type = contrib.get("contribution_type")
-
-                if metric_id and contribution_type == "predefined":
-                    # Calculate total contribution for this metric
-                    total_contribution = operational_count * value_per_agent
-                    metric_map[metric_id] = total_contribution
-
-        return metric_map
+        # Contributions are based on rovers that are currently operational (not throttled)
+        operational_count = self._operational_count
+        return {
+            metric_id: operational_count * value_per_agent for metric_id, value_per_agent in self._metric_contributions
+        }
 
     def get_metrics(self) -> dict:
         """
         Get current science sector metrics.
         """
 
-        operational_rovers = sum(1 for r in self.science_rovers if r.status == RoverStatus.OPERATIONAL)
+        operational_rovers = self._operational_count
 
         return {
             "total_science_cumulative": self.total_science_cumulative,
@@ -375,5 +530,5 @@ class ScienceSector:
             "science_growth_rate": self.current_growth_rate,
             "S_0": self.S_0,
             "rovers_in_pipeline": self.rovers_in_pipeline,
-            "p_eff": self.nominal_productivity_p * self.availability_factor_a * self.utilization_factor_u,
+            "p_eff": self._p_eff,
         }
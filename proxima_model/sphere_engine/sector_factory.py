@@ -4,8 +4,12 @@ Sector Factory
 Provides a centralized factory for creating sector instances dynamically.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 import logging
+import multiprocessing
+
+from mesa import Model
+from proxima_model.event_engine.event_bus import EventBus
 
 from .science_sector import ScienceSector
 from .energy_sector import EnergySector
@@ -16,6 +20,16 @@ from .equipment_manufacturing_sector import EquipmentManSector
 
 logger = logging.getLogger(__name__)
 
+# Sector type -> sector class
+_REGISTRY: Dict[str, type] = {
+    "science": ScienceSector,
+    "energy": EnergySector,
+    "transportation": TransportationSector,
+    "construction": ConstructionSector,
+    "manufacturing": ManufacturingSector,
+    "equipment_manufacturing": EquipmentManSector,
+}
+
 
 class SectorFactory:
     """
@@ -45,20 +59,73 @@ class SectorFactory:
         sector_type = sector_type.lower().strip()
 
         try:
-            if sector_type == "science":
-                return ScienceSector(model, config, event_bus)
-            elif sector_type == "energy":
-                return EnergySector(model, config, event_bus)
-            elif sector_type == "transportation":
-                return TransportationSector(model, config, event_bus)
-            elif sector_type == "construction":
-                return ConstructionSector(model, config, event_bus)
-            elif sector_type == "manufacturing":
-                return ManufacturingSector(model, config, event_bus)
-            elif sector_type == "equipment_manufacturing":
-                return EquipmentManSector(model, config, event_bus)
-            else:
+            sector_cls = _REGISTRY.get(sector_type)
+            if sector_cls is None:
                 raise ValueError(f"Unknown sector type: {sector_type}")
+            return sector_cls(model, config, event_bus)
         except Exception as e:
             logger.error(f"Failed to create sector '{sector_type}': {e}")
             raise
+
+    @staticmethod
+    def run_replicas(
+        sector_type: str,
+        n_replicas: int,
+        config: Dict[str, Any],
+        steps_per_run: int,
+        available_power: float = 0.0,
+        processes: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run independent replicas of a single sector in parallel worker processes.
+
+        Each replica builds its own model, event bus and sector from config and steps it with a fixed power
+        allocation. Replica i is seeded with config["seed"] + i (unseeded if config has no seed).
+
+        Args:
+            sector_type: The type of sector to replicate (e.g., "science").
+            n_replicas: Number of independent runs.
+            config: Sector-specific configuration dictionary shared by all replicas.
+            steps_per_run: Number of steps each replica runs.
+            available_power: Power allocated to the sector on every step.
+            processes: Worker process count (defaults to the CPU count).
+
+        Returns:
+            The final get_metrics() of each replica, in replica order.
+        """
+        base_seed = config.get("seed")
+        jobs = [
+            (
+                sector_type,
+                {**config, "seed": None if base_seed is None else base_seed + i},
+                steps_per_run,
+                available_power,
+            )
+            for i in range(n_replicas)
+        ]
+
+        with multiprocessing.Pool(processes) as pool:
+            return pool.map(_run_replica, jobs)
+
+
+class _ReplicaModel(Model):
+    """Minimal model that drives a single sector for replica runs."""
+
+    def __init__(self, sector_type: str, config: Dict[str, Any], available_power: float):
+        super().__init__(seed=config.get("seed"))
+        self.config = config  # Agents read model-level settings (e.g. ISRU "resources") from here
+        self.available_power = available_power
+        self.event_bus = EventBus()
+        self.sector = SectorFactory.create_sector(sector_type, self, config, self.event_bus)
+
+    def step(self):
+        self.sector.step(self.available_power)
+
+
+def _run_replica(job) -> Dict[str, Any]:
+    """Worker entry point: build one replica, run it and return its final metrics."""
+    sector_type, config, steps, available_power = job
+    model = _ReplicaModel(sector_type, config, available_power)
+    for _ in range(steps):
+        model.step()
+    return model.sector.get_metrics()
@@ -4,14 +4,17 @@ Transportation Sector Manager
 Manages rocket fleet, fuel generation, and transport requests between Earth and Moon.
 """
 
+from collections import deque
+from heapq import heapify, heappop, heappush
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import List, Dict, Optional, Any
+from enum import Enum
+from typing import Callable, Deque, List, Dict, Optional, Any, Tuple
 from proxima_model.components.rocket import Rocket
 from proxima_model.components.fuel_generator import FuelGenerator
 from proxima_model.world_system.world_system_defs import EventType, SectorType
 
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +28,7 @@ class TransportRequestStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransportRequest:
     """Represents a transport request."""
 
@@ -34,6 +37,7 @@ class TransportRequest:
     origin: str
     destination: str
     status: str = "queued"
+    payload_units: float = field(init=False, compare=False)  # Sum of payload amounts, computed once
 
     def __post_init__(self):
         """Validate request after initialization."""
@@ -41,9 +45,10 @@ class TransportRequest:
             raise ValueError("Payload cannot be empty")
         if self.origin == self.destination:
             raise ValueError("Origin and destination cannot be the same")
+        object.__setattr__(self, "payload_units", sum(self.payload.values()))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransportationConfig:
     """Configuration for transportation sector."""
 
@@ -63,7 +68,7 @@ class TransportationConfig:
             raise ValueError("Loading time must be non-negative")
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceStocks:
     """Internal resource stocks for transportation sector."""
 
@@ -79,6 +84,9 @@ class ResourceStocks:
 class TransportationSector:
     """Manages rocket fleet, fuel generation, and transport logistics."""
 
+    # TODO: Placeholder weight per payload unit. This needs to change and be configurable
+    _RETURN_PAYLOAD_KG_MULTIPLIER = 20.0
+
     def __init__(self, model, config: Dict[str, Any], event_bus):
         self.model = model
         self.event_bus = event_bus
@@ -96,16 +104,28 @@ class TransportationSector:
         self._stocks = ResourceStocks()
 
         # Transport queue
-        self.transport_queue: List[TransportRequest] = []
+        self.transport_queue: Deque[TransportRequest] = deque()
+
+        # Events received from the bus, applied in arrival order at the start of the next step
+        self._event_buffer: Deque[Tuple[Callable, Dict[str, Any]]] = deque()
 
         # Initialize rocket fleet from config
         self.rockets: List[Rocket] = []
         self.rocket_configs = config.get("rockets", [])
+
+        # Metric contribution per launch, taken from the first rocket config (same for all)
+        contribution_cfg = (self.rocket_configs[0] if self.rocket_configs else {}).get("metric_contribution", {})
+        self._metric_id = contribution_cfg.get("metric_id")
+        self._value_per_launch = float(contribution_cfg.get("value", 0.0))
         for rocket_config in self.rocket_configs:
             rocket_quantity = rocket_config.get("quantity", 1)
             for _ in range(rocket_quantity):
                 self.rockets.append(Rocket(self.model, rocket_config, event_bus))
 
+        # Fleet indices of available rockets, kept as a min-heap so the first available rocket is found in O(1)
+        self._available_rockets: List[int] = [i for i, rocket in enumerate(self.rockets) if rocket.is_available]
+        heapify(self._available_rockets)
+
         # Initialize fuel generators from config
         self.fuel_generators: List[FuelGenerator] = []
         fuel_gen_configs = config.get("fuel_generators", [])
@@ -115,13 +135,44 @@ class TransportationSector:
             for _ in range(fuel_gen_quantity):
                 self.fuel_generators.append(FuelGenerator(fuel_gen_config))
 
+        # Per-generator He3 rate and kg of propellant per kg of He3, for stepping the whole fleet at once. The sector
+        # only debits He3 that a generator turned into propellant, so fleets with a zero-yield, invalid or negative-rate
+        # generator keep the per-generator loop
+        rates = np.array([float(g.he3_kg_per_hour) for g in self.fuel_generators], dtype=float)
+        prop_per_he3 = np.array(
+            [
+                g.thermal_GWh_per_kg * 1e6 * g.efficiency / g.kwh_per_kg_prop if g.kwh_per_kg_prop > 0 else 0.0
+                for g in self.fuel_generators
+            ],
+            dtype=float,
+        )
+        self._vectorized_fuel = bool(np.all(prop_per_he3 > 0) and np.all(rates >= 0))
+        if self._vectorized_fuel:
+            self._fg_rates_cumsum = np.cumsum(rates)
+            self._fg_prev_cumsum = self._fg_rates_cumsum - rates  # He3 taken by the generators ahead of each one
+            self._fg_prop_per_he3 = prop_per_he3
+
         # Subscribe to events
-        self.event_bus.subscribe(EventType.TRANSPORT_REQUEST.value, self.handle_transport_request)
-        self.event_bus.subscribe(EventType.RESOURCE_ALLOCATED.value, self.handle_resource_allocation)
+        self.event_bus.subscribe(EventType.TRANSPORT_REQUEST.value, self._buffer_transport_request)
+        self.event_bus.subscribe(EventType.RESOURCE_ALLOCATED_BATCH.value, self._buffer_resource_allocation_batch)
 
         # Initialize launch counter for metrics
         self.launches_this_step = 0
 
+    def _buffer_transport_request(self, **kwargs) -> None:
+        """Buffer a transport request event until the next step."""
+        self._event_buffer.append((self.handle_transport_request, kwargs))
+
+    def _buffer_resource_allocation_batch(self, **kwargs) -> None:
+        """Buffer a resource allocation batch event until the next step."""
+        self._event_buffer.append((self.handle_resource_allocation_batch, kwargs))
+
+    def _process_buffered_events(self) -> None:
+        """Apply buffered events in the order they were published."""
+        while self._event_buffer:
+            handler, kwargs = self._event_buffer.popleft()
+            handler(**kwargs)
+
     def handle_transport_request(
         self, requesting_sector: str, payload: Dict[str, float], origin: str, destination: str
     ) -> None:
@@ -134,7 +185,7 @@ class TransportationSector:
             origin: Starting location
             destination: Target location
         """
-        logger.info(f"Transportation Sector received request from {requesting_sector} for {payload}.")
+        logger.info("Transportation Sector received request from %s for %s.", requesting_sector, payload)
 
         try:
             request = TransportRequest(
@@ -146,7 +197,7 @@ class TransportationSector:
             )
             self.transport_queue.append(request)
         except ValueError as e:
-            logger.error(f"Invalid transport request: {e}")
+            logger.error("Invalid transport request: %s", e)
 
     def handle_resource_allocation(self, recipient_sector: str, resource: str, amount: float) -> None:
         """
@@ -162,6 +213,16 @@ class TransportationSector:
                 self._stocks.he3_kg += amount
                 self._fuel_request_pending = False
 
+    def handle_resource_allocation_batch(self, allocations: List[Tuple[str, str, float]]) -> None:
+        """
+        Receive a batch of resource allocations from event bus.
+
+        Args:
+            allocations: List of (recipient_sector, resource, amount) tuples
+        """
+        for recipient_sector, resource, amount in allocations:
+            self.handle_resource_allocation(recipient_sector, resource, amount)
+
     def _request_resources_for_fuel(self) -> None:
         """Request He3 from manufacturing sector if below threshold."""
         if (
@@ -179,6 +240,25 @@ class TransportationSector:
 
     def _generate_fuel(self) -> None:
         """Generate rocket fuel from He3 using fuel generators."""
+        if self._vectorized_fuel:
+            if self._stocks.he3_kg > 0 and self.fuel_generators:
+                # Generators take He3 in fleet order, each up to its rate, until the stock runs out
+                he3_kg = self._stocks.he3_kg
+                consumed = np.diff(np.minimum(self._fg_rates_cumsum, he3_kg), prepend=0.0)
+                produced = consumed * self._fg_prop_per_he3
+                self._stocks.rocket_fuel_kg += float(produced.sum())
+                self._stocks.he3_kg -= float(consumed.sum())
+
+                # Generators that still had He3 left to draw from were stepped; keep their reported state current
+                stepped = int(np.searchsorted(self._fg_prev_cumsum, he3_kg, side="left"))
+                for generator, he3_consumed, prop_generated in zip(
+                    self.fuel_generators[:stepped], consumed[:stepped].tolist(), produced[:stepped].tolist()
+                ):
+                    generator.is_operational = he3_consumed > 0.0
+                    generator.prop_generated_kg = prop_generated
+            return
+
+        # A generator with an invalid configuration raises from its own step
         for generator in self.fuel_generators:
             if self._stocks.he3_kg > 0:
                 he3_consumed, prop_generated = generator.step(self._stocks.he3_kg)
@@ -188,21 +268,28 @@ class TransportationSector:
 
     def _process_transport_queue(self) -> None:
         """Process queued transport requests and launch rockets if fuel permits."""
+        # Requests that could not launch this step, oldest first
+        delayed: Deque[TransportRequest] = deque()
+
         # Process in reverse order (LIFO - most recent first)
-        for request in reversed(self.transport_queue):
+        while self.transport_queue:
             # Find available rocket
             available_rocket = self._find_available_rocket()
 
             if not available_rocket:
                 break  # No more available rockets
 
-            # Attempt to launch rocket for this request
-            if self._attempt_launch(available_rocket, request):
-                self.transport_queue.remove(request)
+            # Attempt to launch rocket for the most recent request; keep it queued if the launch is delayed
+            request = self.transport_queue.pop()
+            if not self._attempt_launch(available_rocket, request):
+                delayed.appendleft(request)
+
+        # Delayed requests are newer than any left unprocessed, so they go back on the right end
+        self.transport_queue.extend(delayed)
 
     def _find_available_rocket(self) -> Optional[Rocket]:
         """Find first available rocket in fleet."""
-        return next((r for r in self.rockets if r.is_available), None)
+        return self.rockets[self._available_rockets[0]] if self._available_rockets else None
 
     def _attempt_launch(self, rocket: Rocket, request: TransportRequest) -> bool:
         """
@@ -217,9 +304,7 @@ class TransportationSector:
         """
         # Calculate payload weights
         return_payload = request.payload
-        return_payload_kg = (
-            sum(return_payload.values()) * 20
-        )  # TODO: Placeholder weight. This needs to change and be configurable
+        return_payload_kg = request.payload_units * self._RETURN_PAYLOAD_KG_MULTIPLIER
         outbound_payload = {}
         outbound_payload_kg = 0.0
 
@@ -232,7 +317,7 @@ class TransportationSector:
 
         # Check if enough fuel available
         if propellant_needed > 0 and self._stocks.rocket_fuel_kg >= propellant_needed:
-            logger.info(f"Launching rocket {rocket.unique_id} for request. " f"Fuel used: {propellant_needed:.2f} kg.")
+            logger.info("Launching rocket %s for request. Fuel used: %.2f kg.", rocket.unique_id, propellant_needed)
 
             # Deduct fuel
             self._stocks.rocket_fuel_kg -= propellant_needed
@@ -248,21 +333,33 @@ class TransportationSector:
                 requesting_sector=request.requesting_sector,
             )
 
+            # The launched rocket is always the first available one
+            heappop(self._available_rockets)
+
             # Record successful launch for metrics
             self.launches_this_step += 1
 
             return True
         else:
             logger.warning(
-                f"Launch of rocket {rocket.unique_id} delayed: "
-                f"Not enough fuel (need {propellant_needed:.2f} kg, have {self._stocks.rocket_fuel_kg:.2f} kg)."
+                "Launch of rocket %s delayed: Not enough fuel (need %.2f kg, have %.2f kg).",
+                rocket.unique_id,
+                propellant_needed,
+                self._stocks.rocket_fuel_kg,
             )
             return False
 
     def _step_all_rockets(self) -> None:
         """Advance mission state for all rockets."""
-        for rocket in self.rockets:
+        for index, rocket in enumerate(self.rockets):
+            if rocket.is_available:
+                rocket.step()
+                continue
+
             rocket.step()
+            if rocket.is_available:
+                # Round trip complete, the rocket can be launched again
+                heappush(self._available_rockets, index)
 
     def get_power_demand(self) -> float:
         """
@@ -279,6 +376,7 @@ class TransportationSector:
         Execute single simulation step for transportation sector.
 
         Execution Order:
+        0. Apply events received since the last step
         1. Generate fuel from He3
         2. Process transport queue and launch rockets
         3. Advance all rocket mission states
@@ -289,6 +387,9 @@ class TransportationSector:
         # Reset launch counter
         self.launches_this_step = 0
 
+        # 0. Apply Buffered Events
+        self._process_buffered_events()
+
         # 1. Generate Fuel
         self._request_resources_for_fuel()
         self._generate_fuel()
@@ -303,21 +404,18 @@ class TransportationSector:
         """
         Create a map of metric contributions from rocket launches.
         """
-        metric_map = {}
-
-        # Get rocket configs to find metric contribution
-        if self.rocket_configs and self.launches_this_step > 0:
-            # Get metric_contribution from first rocket config (same for all)
-            contribution_cfg = self.rocket_configs[0].get("metric_contribution", {})
-            metric_id = contribution_cfg.get("metric_id")
-            value_per_launch = float(contribution_cfg.get("value", 0.0))
-            if metric_id:
-                metric_map[metric_id] = self.launches_this_step * value_per_launch
-                logger.info(
-                    f"🚀 Rocket launches: {self.launches_this_step} × {value_per_launch} = {metric_map[metric_id]} dust impact"
-                )
-
-        return metric_map
+        if not self._metric_id or self.launches_this_step <= 0:
+            return {}
+
+        contribution = self.launches_this_step * self._value_per_launch
+        logger.info(
+            "🚀 Rocket launches: %s × %s = %s dust impact",
+            self.launches_this_step,
+            self._value_per_launch,
+            contribution,
+        )
+
+        return {self._metric_id: contribution}
 
     def get_metrics(self) -> Dict[str, Any]:
         """
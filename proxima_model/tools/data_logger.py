@@ -11,24 +11,40 @@ Maintains structured logs with sector organization and automatic timestamp gener
 FEATURES:
 =========
 - Dual output: CSV files and MongoDB time-series collection
+- MongoDB log inserts batched into bulk writes
 - Automatic log clearing on initialization
 - Nested sector data with automatic flattening for CSV
-- World system state updates
+- CSV rows streamed to disk as they are logged
+- World system state updates, sending only the fields that changed
 - Configurable logging targets
 """
 
 from __future__ import annotations
-import pandas as pd
+import atexit
+import csv
 import logging
+import queue
+import shutil
+import sys
+import threading
+import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TextIO
+from pymongo import InsertOne
+from pymongo.errors import CollectionInvalid
 from data_engine.proxima_db_engine import ProximaDB
 
 logger = logging.getLogger(__name__)
 
+# Simulated time per step
+_STEP_DURATION = timedelta(hours=1)
+
+# Queue item telling the background writer to exit
+_STOP = object()
+
 
 class LogLevel(Enum):
     """Log verbosity levels."""
@@ -57,6 +73,9 @@ class LoggerConfig:
     log_to_csv: bool = True
     log_to_db: bool = True
     base_time: Optional[datetime] = None
+    db_batch_size: int = 256  # Flush buffered log documents once this many are pending
+    db_flush_interval_s: float = 0.05  # ... or once this long has passed since the last flush
+    ws_full_state_interval: int = 100  # Rewrite the whole world system state every N updates instead of a diff
 
     def __post_init__(self):
         """Validate configuration."""
@@ -64,13 +83,47 @@ class LoggerConfig:
             raise ValueError("experiment_id cannot be empty")
         if not self.ws_id:
             raise ValueError("ws_id cannot be empty")
+        if self.db_batch_size < 1:
+            raise ValueError("db_batch_size must be at least 1")
+        if self.db_flush_interval_s < 0:
+            raise ValueError("db_flush_interval_s cannot be negative")
+        if self.ws_full_state_interval < 1:
+            raise ValueError("ws_full_state_interval must be at least 1")
 
         # Set default base time if not provided
         if self.base_time is None:
             self.base_time = datetime.now(timezone.utc)
 
 
-@dataclass
+def _flat_columns(templates: Dict[Any, tuple], template_key: Any, prefix: str, values: Dict[str, Any]) -> tuple:
+    """Return the "<prefix>_<key>" column names for values, rebuilding the cached template only if its keys changed."""
+    keys = tuple(values)
+    template = templates.get(template_key)
+    if template is None or template[0] != keys:
+        template = templates[template_key] = (keys, tuple(sys.intern(f"{prefix}_{key}") for key in keys))
+    return template[1]
+
+
+def _state_changes(old: Dict[str, Any], new: Dict[str, Any], path: str, changes: Dict[str, Any]) -> None:
+    """
+    Collect the dotted-path $set fields that turn old into new.
+
+    Nested dicts with the same keys are compared field by field; anything else that differs (values, lists,
+    added or removed keys, keys that are not valid path segments) is replaced whole under its parent path.
+    """
+    if old.keys() != new.keys() or any("." in key or key.startswith("$") for key in new):
+        changes[path] = new
+        return
+
+    for key, value in new.items():
+        previous = old[key]
+        if isinstance(value, dict) and isinstance(previous, dict):
+            _state_changes(previous, value, f"{path}.{key}", changes)
+        elif value != previous:
+            changes[f"{path}.{key}"] = value
+
+
+@dataclass(slots=True)
 class LogEntry:
     """Represents a single log entry."""
 
@@ -91,8 +144,17 @@ class LogEntry:
         doc.update(self.sector_data)
         return doc
 
-    def to_flat_record(self) -> Dict[str, Any]:
-        """Convert to flat dictionary for CSV."""
+    def to_flat_record(self, column_templates: Optional[Dict[Any, tuple]] = None) -> Dict[str, Any]:
+        """
+        Convert to flat dictionary for CSV.
+
+        Args:
+            column_templates: Optional cache of flattened column names per nested dict, reused across
+                entries so steady sector schemas are flattened without rebuilding any names
+        """
+        if column_templates is None:
+            column_templates = {}
+
         flat_record = {
             "experiment_id": self.experiment_id,
             "step": self.step,
@@ -101,16 +163,21 @@ class LogEntry:
 
         # Flatten nested dictionaries
         for sector_name, sector_values in self.sector_data.items():
-            if isinstance(sector_values, dict):
-                for key, value in sector_values.items():
-                    # Special case: performance.metrics expansion
-                    if sector_name == "performance" and key == "metrics" and isinstance(value, dict):
-                        for metric_id, metric_value in value.items():
-                            flat_record[f"metric_{metric_id}"] = metric_value
+            if not isinstance(sector_values, dict):
+                flat_record[sector_name] = sector_values
+                continue
+
+            columns = _flat_columns(column_templates, sector_name, sector_name, sector_values)
+            if sector_name == "performance" and isinstance(sector_values.get("metrics"), dict):
+                # Special case: performance.metrics expansion
+                for column, (key, value) in zip(columns, sector_values.items()):
+                    if key == "metrics":
+                        metric_columns = _flat_columns(column_templates, ("performance", "metrics"), "metric", value)
+                        flat_record.update(zip(metric_columns, value.values()))
                     else:
-                        flat_record[f"{sector_name}_{key}"] = value
+                        flat_record[column] = value
             else:
-                flat_record[sector_name] = sector_values
+                flat_record.update(zip(columns, sector_values.values()))
 
         return flat_record
 
@@ -125,12 +192,16 @@ class DataLogger:
     - Nested sector data with flattening for CSV compatibility
     - World system state synchronization
     - Automatic cleanup of previous experiment logs
+    - Optional background writer thread so log() does not block the simulation step
     """
 
     # Collection names
     COLLECTION_LOGS = "logs_simulation"
     COLLECTION_WORLD_SYSTEMS = "world_systems"
 
+    # Logs are stored as a time series: one bucket per experiment, one simulated hour per step
+    LOGS_TIMESERIES = {"timeField": "timestamp", "metaField": "experiment_id", "granularity": "hours"}
+
     def __init__(
         self,
         experiment_id: str,
@@ -139,6 +210,12 @@ class DataLogger:
         log_dir: str = "log_files",
         log_to_csv: bool = True,
         log_to_db: bool = True,
+        db_batch_size: int = 256,
+        db_flush_interval_s: float = 0.05,
+        ws_full_state_interval: int = 100,
+        background: bool = False,
+        queue_size: int = 4096,
+        reset: bool = False,
     ):
         """
         Initialize data logger with configuration.
@@ -150,6 +227,14 @@ class DataLogger:
             log_dir: Directory for CSV log files
             log_to_csv: Whether to log to CSV files
             log_to_db: Whether to log to MongoDB
+            db_batch_size: Number of log documents buffered before a bulk write
+            db_flush_interval_s: Maximum time in seconds log documents stay buffered. The background writer flushes
+                on a timer; without it the interval is checked on each log call (and on save_to_file/close)
+            ws_full_state_interval: Number of world system state updates between full rewrites; the others only
+                set the fields that changed since the previous update
+            background: Whether to write logs from a background thread
+            queue_size: Maximum number of log calls queued for the background writer; log() blocks when full
+            reset: Whether to drop the logs of every experiment instead of only this one
         """
         # Create configuration
         self._config = LoggerConfig(
@@ -158,10 +243,31 @@ class DataLogger:
             log_dir=log_dir,
             log_to_csv=log_to_csv,
             log_to_db=log_to_db,
+            db_batch_size=db_batch_size,
+            db_flush_interval_s=db_flush_interval_s,
+            ws_full_state_interval=ws_full_state_interval,
         )
 
         self.db = db
-        self._records: List[Dict[str, Any]] = []
+        # Streaming CSV output, opened on the first record
+        self._csv_file: Optional[TextIO] = None
+        self._csv_writer: Optional[csv.DictWriter] = None
+        self._csv_fieldnames: List[str] = []
+        self._csv_fieldset: set = set()
+        self._csv_rows = 0
+
+        # Flattened CSV column names per sector, built once and reused every step
+        self._column_templates: Dict[Any, tuple] = {}
+
+        # Pending database writes: log inserts and the latest world system state (only the newest matters)
+        self._db_buffer: List[InsertOne] = []
+        self._ws_pending_state: Optional[Dict[str, Any]] = None
+        self._last_db_flush = time.monotonic()
+        self._flush_lock = threading.Lock()  # The background writer may flush while save_to_file does
+
+        # Last world system state written, to send only what changed (None forces a full rewrite)
+        self._ws_written_state: Optional[Dict[str, Any]] = None
+        self._ws_updates_since_full = 0
 
         # Setup logging directory
         self._log_path = Path(self._config.log_dir)
@@ -171,20 +277,67 @@ class DataLogger:
         timestamp = datetime.now(timezone.utc).timestamp()
         self._csv_path = self._log_path / f"simlog_{experiment_id}_{timestamp}.csv"
 
-        # Clear existing logs for this experiment
+        # Make sure logs go to a time-series collection, then clear existing logs for this experiment
+        if reset:
+            self._drop_logs()
+        self._ensure_log_collection()
         self._clear_existing_logs()
 
+        # Background writer: log() only queues, the writer thread formats and writes
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._writer = threading.Thread(target=self._writer_loop, name="DataLoggerWriter", daemon=True)
+            self._writer.start()
+
+        # Write out anything still buffered if the process exits without close(); close() removes the hook again
+        # so the exit handler list doesn't keep finished loggers alive
+        atexit.register(self.close)
+        self._exit_hook_registered = True
+
+    def _ensure_log_collection(self) -> None:
+        """Create the logs collection as a time-series collection bucketed by experiment if it does not exist."""
+        if not self._config.log_to_db:
+            return
+
+        try:
+            self.db.db.create_collection(self.COLLECTION_LOGS, timeseries=self.LOGS_TIMESERIES)
+            logger.info(f"✅ Created time-series collection {self.COLLECTION_LOGS}")
+        except CollectionInvalid:
+            pass  # Already exists
+        except Exception as e:
+            logger.warning(f"⚠️  Could not create time-series collection {self.COLLECTION_LOGS}: {e}")
+
     def _clear_existing_logs(self) -> None:
         """Clear existing logs for this experiment from database."""
         if not self._config.log_to_db:
             return
 
         try:
-            result = self.db.db[self.COLLECTION_LOGS].delete_many({"experiment_id": self._config.experiment_id})
+            # experiment_id is the collection's metaField, so the delete removes whole buckets. New experiments
+            # have nothing to clear, which a single indexed lookup settles
+            collection = self.db.db[self.COLLECTION_LOGS]
+            experiment_filter = {"experiment_id": self._config.experiment_id}
+            if collection.find_one(experiment_filter, projection={"_id": 1}) is None:
+                return
+
+            result = collection.delete_many(experiment_filter)
             logger.info(f"🗑️  Cleared {result.deleted_count} existing logs for experiment: {self._config.experiment_id}")
         except Exception as e:
             logger.warning(f"⚠️  Could not clear existing logs: {e}")
 
+    def _drop_logs(self) -> None:
+        """Drop the logs collection, clearing the logs of all experiments."""
+        if not self._config.log_to_db:
+            return
+
+        try:
+            self.db.db[self.COLLECTION_LOGS].drop()
+            logger.info(f"🗑️  Dropped {self.COLLECTION_LOGS}")
+        except Exception as e:
+            logger.warning(f"⚠️  Could not drop {self.COLLECTION_LOGS}: {e}")
+
     def _generate_timestamp(self, step: int) -> datetime:
         """
         Generate timestamp for a given step.
@@ -195,11 +348,11 @@ class DataLogger:
         Returns:
             Datetime representing the step (base_time + step hours)
         """
-        return self._config.base_time + timedelta(hours=step)
+        return self._config.base_time + step * _STEP_DURATION
 
     def _log_to_database(self, entry: LogEntry) -> None:
         """
-        Log entry to MongoDB database.
+        Buffer entry for MongoDB and flush once the batch is full or the flush window has passed.
 
         Args:
             entry: LogEntry to persist
@@ -207,31 +360,129 @@ class DataLogger:
         if not self._config.log_to_db:
             return
 
+        # Buffer log document
+        self._db_buffer.append(InsertOne(entry.to_db_document()))
+
+        # Keep only the most recent world system state if provided
+        if entry.latest_state:
+            self._ws_pending_state = {**entry.latest_state, "sectors": entry.sector_data}
+
+        if (
+            len(self._db_buffer) >= self._config.db_batch_size
+            or time.monotonic() - self._last_db_flush >= self._config.db_flush_interval_s
+        ):
+            self.flush_db_buffer()
+
+    def flush_db_buffer(self) -> None:
+        """Write buffered log documents in one bulk write and push the latest world system state."""
+        with self._flush_lock:
+            self._flush_db_buffer()
+
+    def _flush_db_buffer(self) -> None:
+        """Flush body; callers hold _flush_lock."""
+        self._last_db_flush = time.monotonic()
+        if not self._db_buffer and self._ws_pending_state is None:
+            return
+
+        requests, self._db_buffer = self._db_buffer, []
+        latest_state, self._ws_pending_state = self._ws_pending_state, None
+
         try:
-            # Insert log document
-            self.db.db[self.COLLECTION_LOGS].insert_one(entry.to_db_document())
-
-            # Update world system state if provided
-            if entry.latest_state:
-                complete_state = {**entry.latest_state, "sectors": entry.sector_data}
-                self.db.db[self.COLLECTION_WORLD_SYSTEMS].update_one(
-                    {"_id": self._config.ws_id},
-                    {"$set": {"latest_state": complete_state}},
-                )
+            if requests:
+                self.db.db[self.COLLECTION_LOGS].bulk_write(requests, ordered=False)
+
+            if latest_state is not None:
+                self._write_ws_state(latest_state)
         except Exception as e:
-            logger.warning(f"⚠️  Warning: Could not insert log entry for step {entry.step}: {e}")
+            logger.warning(f"⚠️  Warning: Could not write {len(requests)} buffered log entries: {e}")
+
+    def _write_ws_state(self, latest_state: Dict[str, Any]) -> None:
+        """Update the world system's latest_state, setting only changed fields between periodic full rewrites."""
+        previous = self._ws_written_state
+        if previous is None or self._ws_updates_since_full >= self._config.ws_full_state_interval:
+            changes = {"latest_state": latest_state}
+            self._ws_updates_since_full = 0
+        else:
+            changes = {}
+            _state_changes(previous, latest_state, "latest_state", changes)
+
+        # Forget the written state until the update succeeds, so a failed write is followed by a full rewrite
+        self._ws_written_state = None
+        if changes:
+            self.db.db[self.COLLECTION_WORLD_SYSTEMS].update_one({"_id": self._config.ws_id}, {"$set": changes})
+        self._ws_written_state = latest_state
+        self._ws_updates_since_full += 1
 
     def _log_to_csv(self, entry: LogEntry) -> None:
         """
-        Add entry to CSV buffer.
+        Write entry as a row of the CSV log.
 
         Args:
-            entry: LogEntry to buffer for CSV
+            entry: LogEntry to write to CSV
         """
         if not self._config.log_to_csv:
             return
 
-        self._records.append(entry.to_flat_record())
+        record = entry.to_flat_record(self._column_templates)
+        try:
+            self._csv_writer_for(record).writerow(record)
+            self._csv_rows += 1
+        except Exception as e:
+            logger.error(f"⚠️  Could not write CSV log row for step {entry.step}: {e}")
+
+    def _csv_writer_for(self, record: Dict[str, Any]) -> csv.DictWriter:
+        """Return a writer whose header covers every column of record, opening or rewriting the file as needed."""
+        if not self._csv_fieldnames:
+            # First record fixes the column order
+            self._write_csv(list(record))
+        elif any(key not in self._csv_fieldset for key in record):
+            # New columns appeared (e.g. a metric reported for the first time): widen the header
+            new_fields = [key for key in record if key not in self._csv_fieldset]
+            self._extend_csv_header(new_fields)
+            logger.info(f"📄 CSV log header extended with {len(new_fields)} new columns")
+        elif self._csv_file is None:
+            # Reopened after close(): keep appending to the same file
+            self._csv_file = open(self._csv_path, "a", newline="", buffering=1 << 20)
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=self._csv_fieldnames, lineterminator="\n")
+        return self._csv_writer
+
+    def _write_csv(self, fieldnames: List[str]) -> None:
+        """Create the CSV file with the given header."""
+        self._csv_fieldnames = fieldnames
+        self._csv_fieldset = set(fieldnames)
+        self._csv_file = open(self._csv_path, "w", newline="", buffering=1 << 20)
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=fieldnames, lineterminator="\n")
+        self._csv_writer.writeheader()
+
+    def _extend_csv_header(self, new_fields: List[str]) -> None:
+        """
+        Rewrite the CSV header with new_fields appended, keeping the rows already written.
+
+        New columns only ever go at the end, so earlier rows are copied byte for byte (no parsing, values unchanged)
+        and simply lack the trailing columns, which CSV readers fill in as empty. The copy costs O(file size) per
+        schema change. Schema changes happen only when a column appears for the first time, so the cost is bounded
+        by the number of distinct columns, not paid per row.
+        """
+        self._close_csv()
+        fieldnames = self._csv_fieldnames + new_fields
+        widened_path = self._csv_path.with_name(self._csv_path.name + ".tmp")
+        with open(self._csv_path, newline="") as src, open(widened_path, "w", newline="") as dst:
+            src.readline()  # Old header (column names never contain line breaks)
+            csv.writer(dst, lineterminator="\n").writerow(fieldnames)
+            shutil.copyfileobj(src, dst, 1 << 20)
+        widened_path.replace(self._csv_path)
+
+        self._csv_fieldnames = fieldnames
+        self._csv_fieldset = set(fieldnames)
+        self._csv_file = open(self._csv_path, "a", newline="", buffering=1 << 20)
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=fieldnames, lineterminator="\n")
+
+    def _close_csv(self) -> None:
+        """Close the CSV file if it is open."""
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
 
     def log(self, step: int, **kwargs) -> None:
         """
@@ -241,58 +492,130 @@ class DataLogger:
             step: Current simulation step
             **kwargs: Sector data and optional latest_state
         """
+        if not (self._config.log_to_db or self._config.log_to_csv):
+            return
+
+        # Logging again after close(): flush at exit again
+        if not self._exit_hook_registered:
+            atexit.register(self.close)
+            self._exit_hook_registered = True
+
         # Extract latest_state if present
         latest_state = kwargs.pop("latest_state", None)
 
+        if self._writer is not None:
+            self._queue.put((step, kwargs, latest_state))
+        else:
+            self._write(step, kwargs, latest_state)
+
+    def _write(self, step: int, sector_data: Dict[str, Any], latest_state: Optional[Dict[str, Any]]) -> None:
+        """Write one log call to the configured destinations."""
         # Create log entry
         entry = LogEntry(
             experiment_id=self._config.experiment_id,
             step=step,
             timestamp=self._generate_timestamp(step),
-            sector_data=kwargs,
+            sector_data=sector_data,
             latest_state=latest_state,
         )
 
         # Log to configured destinations
-        self._log_to_database(entry)
-        self._log_to_csv(entry)
+        if self._config.log_to_db:
+            self._log_to_database(entry)
+        if self._config.log_to_csv:
+            self._log_to_csv(entry)
+
+    def _writer_loop(self) -> None:
+        """Background thread: write queued log calls until told to stop, flushing buffered documents on time."""
+        while True:
+            # While documents are buffered, wake up when they are due instead of waiting for the next log call
+            timeout = None
+            if self._db_buffer or self._ws_pending_state is not None:
+                timeout = max(0.0, self._last_db_flush + self._config.db_flush_interval_s - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self.flush_db_buffer()
+                continue
+
+            try:
+                if item is _STOP:
+                    return
+                self._write(*item)
+            except Exception as e:
+                logger.error(f"⚠️  Background log writer failed for step {item[0]}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _drain(self) -> None:
+        """Wait until the background writer has written everything queued so far."""
+        if self._writer is not None:
+            self._queue.join()
 
     def save_to_file(self) -> None:
-        """Save buffered CSV records to file."""
-        if not self._config.log_to_csv or not self._records:
+        """Flush buffered database writes and CSV rows to disk."""
+        self._drain()
+
+        if self._config.log_to_db:
+            self.flush_db_buffer()
+
+        if not self._config.log_to_csv or self._csv_file is None:
             return
 
         try:
-            df = pd.DataFrame(self._records)
-            df.to_csv(self._csv_path, index=False)
+            self._csv_file.flush()
             logger.info(f"📄 Log saved to {self._csv_path}")
         except Exception as e:
             logger.error(f"⚠️  Could not save CSV log: {e}")
 
-    def create_unique_index(self) -> None:
+    def create_log_index(self) -> None:
         """
-        Create unique index on logs collection to prevent duplicates.
+        Create index on logs collection for per-experiment step queries.
 
-        Should be run once during setup. Safe to call multiple times
-        (will report if index already exists).
+        Time-series collections do not support unique indexes, so this is a plain compound index.
+        Should be run once during setup. Safe to call multiple times.
         """
         if not self._config.log_to_db:
             return
 
         try:
-            self.db.db[self.COLLECTION_LOGS].create_index([("experiment_id", 1), ("step", 1)], unique=True)
-            logger.info("✅ Created unique index on logs_simulation collection")
+            self.db.db[self.COLLECTION_LOGS].create_index([("experiment_id", 1), ("step", 1)])
+            logger.info("✅ Created index on logs_simulation collection")
         except Exception as e:
-            logger.error(f"ℹ️  Index may already exist: {e}")
+            logger.error(f"ℹ️  Could not create index: {e}")
 
     def get_config(self) -> LoggerConfig:
         """Get current logger configuration (read-only copy)."""
         return self._config
 
     def get_record_count(self) -> int:
-        """Get number of buffered CSV records."""
-        return len(self._records)
+        """Get number of CSV records written."""
+        self._drain()
+        return self._csv_rows
 
     def clear_csv_buffer(self) -> None:
-        """Clear buffered CSV records without saving."""
-        self._records.clear()
+        """Discard the CSV records written so far; the next record starts a new file."""
+        self._drain()
+        self._close_csv()
+        self._csv_fieldnames = []
+        self._csv_fieldset = set()
+        self._csv_rows = 0
+        self._csv_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """
+        Stop the background writer, flush all pending output and close the CSV file; call once the run is over.
+
+        Safe to call more than once; it also runs at interpreter exit.
+        """
+        if self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join()
+            self._writer = None
+
+        self.save_to_file()
+        self._close_csv()
+
+        if self._exit_hook_registered:
+            atexit.unregister(self.close)
+            self._exit_hook_registered = False
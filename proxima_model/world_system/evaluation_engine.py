@@ -14,6 +14,8 @@ from typing import Dict, Any, Optional, Set, List
 from dataclasses import dataclass
 import logging
 
+import numpy as np
+
 from proxima_model.policy_engine.metrics import (
     MetricDefinition,
     MetricScore,
@@ -23,6 +25,11 @@ from proxima_model.policy_engine.metrics import (
 
 logger = logging.getLogger(__name__)
 
+# Metric status strings, resolved once
+_STATUS_WITHIN = MetricStatus.WITHIN.value
+_STATUS_OUTSIDE = MetricStatus.OUTSIDE.value
+_STATUS_UNKNOWN = MetricStatus.UNKNOWN.value
+
 
 @dataclass
 class EvaluationResult:
@@ -76,9 +83,39 @@ class EvaluationEngine:
             pg.metric_id: pg for pg in self.performance_goals if pg.metric_id
         }
 
+        # Static part of each metric's score report (name, unit, type, goal), built once
+        self._score_meta: Dict[str, tuple] = {}
+        for metric_id in [*self._metric_definitions, *self._goals_by_metric]:
+            mdef = self._metric_definitions.get(metric_id)
+            goal = self._goals_by_metric.get(metric_id)
+            self._score_meta[metric_id] = (
+                mdef.name if mdef else metric_id,
+                mdef.unit if mdef else None,
+                mdef.type if mdef else "positive",
+                goal.to_dict() if goal else None,
+            )
+
+        # Goals partitioned by direction and packed into arrays, so each direction's rule is applied to its own
+        # goals only. Goal IDs are ordered minimize goals first, then maximize goals
+        min_goals = [goal for goal in self._goals_by_metric.values() if goal.direction == "minimize"]
+        max_goals = [goal for goal in self._goals_by_metric.values() if goal.direction != "minimize"]
+        self._goal_ids: List[str] = [goal.metric_id for goal in min_goals + max_goals]
+        self._n_minimize = len(min_goals)
+
+        self._min_targets = np.array([goal.target_value for goal in min_goals], dtype=float)
+        min_baselines = np.where(self._min_targets > 0, self._min_targets * 2.0, 1.0)
+        self._min_spans = min_baselines - self._min_targets
+
+        self._max_targets = np.array([goal.target_value for goal in max_goals], dtype=float)
+        self._max_positive = self._max_targets > 0
+        self._max_safe_targets = np.where(self._max_positive, self._max_targets, 1.0)
+
         # Initialize performance metrics (current values of how well the system is doing)
         self.performance_metrics: Dict[str, float] = {metric_id: 0.0 for metric_id in self._metric_definitions.keys()}
 
+        # Copy of performance_metrics handed out by evaluate(); reused until a metric changes
+        self._metrics_snapshot: Optional[Dict[str, float]] = None
+
         logger.info(
             f"✅ Evaluation engine initialized: "
             f"{len(self._metric_definitions)} metrics, "
@@ -96,6 +133,7 @@ class EvaluationEngine:
     def set_performance_metric(self, metric_id: str, value: float) -> None:
         """Set the value of a performance metric."""
         self.performance_metrics[metric_id] = float(value)
+        self._metrics_snapshot = None
 
     def apply_metric_contributions(self, sector_metrics: Dict[str, Dict[str, Any]]) -> Dict[str, float]:
         """
@@ -108,27 +146,30 @@ class EvaluationEngine:
             Aggregated contributions by metric_id
         """
         aggregated_contrib: Dict[str, float] = {}
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # Accumulate contributions from all sectors
         for sector_name, metrics in sector_metrics.items():
-            if not metrics:
+            contributions = metrics.get("metric_contributions") if metrics else None
+            if not contributions:
                 continue
 
-            contributions = metrics.get("metric_contributions", {})
-
-            if contributions:
-                logger.debug(f"🔍 {sector_name}: {contributions}")
-
+            if debug:
+                logger.debug("🔍 %s: %s", sector_name, contributions)
             for metric_id, delta in contributions.items():
                 aggregated_contrib[metric_id] = aggregated_contrib.get(metric_id, 0.0) + float(delta)
 
-        if aggregated_contrib:
-            logger.debug(f"🌪️ Total contributions: {aggregated_contrib}")
+        if not aggregated_contrib:
+            return aggregated_contrib
+
+        if debug:
+            logger.debug("🌪️ Total contributions: %s", aggregated_contrib)
 
         # Apply contributions to performance metrics
+        performance_metrics = self.performance_metrics
         for metric_id, delta in aggregated_contrib.items():
-            current_value = self.get_performance_metric(metric_id)
-            self.set_performance_metric(metric_id, current_value + delta)
+            performance_metrics[metric_id] = performance_metrics.get(metric_id, 0.0) + delta
+        self._metrics_snapshot = None
 
         return aggregated_contrib
 
@@ -195,15 +236,15 @@ class EvaluationEngine:
         """
         goal = self._goals_by_metric.get(metric_id)
         if not goal:
-            return MetricStatus.UNKNOWN.value
+            return _STATUS_UNKNOWN
 
         current = self.get_performance_metric(metric_id)
 
         # Status based on goal achievement
         if goal.direction == "minimize":
-            return MetricStatus.WITHIN.value if current <= goal.target_value else MetricStatus.OUTSIDE.value
+            return _STATUS_WITHIN if current <= goal.target_value else _STATUS_OUTSIDE
         else:  # maximize
-            return MetricStatus.WITHIN.value if current >= goal.target_value else MetricStatus.OUTSIDE.value
+            return _STATUS_WITHIN if current >= goal.target_value else _STATUS_OUTSIDE
 
     def build_metric_score(self, metric_id: str) -> Dict[str, Any]:
         """
@@ -215,29 +256,66 @@ class EvaluationEngine:
         Returns:
             Dictionary containing metric score information
         """
-        mdef = self._metric_definitions.get(metric_id)
-        goal = self._goals_by_metric.get(metric_id)
-        current = self.get_performance_metric(metric_id)
+        return self._score_report(metric_id, self.determine_metric_status(metric_id), self.calculate_score(metric_id))
 
-        # Determine status based on goal
-        status = self.determine_metric_status(metric_id)
+    def _score_report(self, metric_id: str, status: str, score_value: Optional[float]) -> Dict[str, Any]:
+        """Assemble a metric's score report from its static metadata and this step's status and score."""
+        meta = self._score_meta.get(metric_id)
+        if meta is None:
+            meta = (metric_id, None, "positive", None)
+        name, unit, metric_type, goal = meta
 
-        # Calculate score
-        score_value = self.calculate_score(metric_id)
-
-        # Build score entry
+        # Build score entry; each report gets its own copy of the shared goal metadata
         score = MetricScore(
-            name=mdef.name if mdef else metric_id,
-            unit=mdef.unit if mdef else None,
-            type=mdef.type if mdef else "positive",
-            current=current,
+            name=name,
+            unit=unit,
+            type=metric_type,
+            current=self.get_performance_metric(metric_id),
             status=status,
             score=score_value,
-            goal=goal.to_dict() if goal else None,
+            goal=dict(goal) if goal else None,
         )
 
         return score.to_dict()
 
+    def calculate_goal_scores(self) -> Dict[str, tuple]:
+        """
+        Score every metric that has a goal in one vectorized pass.
+
+        Applies the same rules as calculate_score and determine_metric_status.
+
+        Returns:
+            Dictionary of metric ID to (score, status)
+        """
+        if not self._goal_ids:
+            return {}
+
+        performance_metrics = self.performance_metrics
+        current = np.fromiter(
+            (performance_metrics.get(metric_id, 0.0) for metric_id in self._goal_ids),
+            dtype=float,
+            count=len(self._goal_ids),
+        )
+        min_current, max_current = current[: self._n_minimize], current[self._n_minimize :]
+
+        # Minimize: 1.0 at or below target, falling linearly to 0.0 at the baseline (2x target, or 1.0)
+        min_within = min_current <= self._min_targets
+        min_score = np.where(
+            min_within, 1.0, np.maximum(1.0 - (min_current - self._min_targets) / self._min_spans, 0.0)
+        )
+
+        # Maximize: 1.0 at or above target, otherwise proportional to the target (0.0 for non-positive targets)
+        max_within = max_current >= self._max_targets
+        max_score = np.where(max_within, 1.0, np.where(self._max_positive, max_current / self._max_safe_targets, 0.0))
+
+        scores = np.concatenate((min_score, max_score)).tolist()
+        within = np.concatenate((min_within, max_within)).tolist()
+
+        return {
+            metric_id: (score, _STATUS_WITHIN if is_within else _STATUS_OUTSIDE)
+            for metric_id, score, is_within in zip(self._goal_ids, scores, within)
+        }
+
     def build_all_scores(self, selected_ids: Optional[Set[str]] = None) -> Dict[str, Dict[str, Any]]:
         """
         Build a unified score report for metrics.
@@ -248,14 +326,19 @@ class EvaluationEngine:
         Returns:
             Dictionary of metric IDs to score information
         """
-        # Union of all known metric IDs
-        all_ids = set(self._metric_definitions.keys()) | set(self._goals_by_metric.keys())
+        # All known metric IDs, filtered by selected_ids if provided
+        all_ids = self._score_meta.keys()
+        ids_to_process = [metric_id for metric_id in all_ids if metric_id in selected_ids] if selected_ids else all_ids
 
-        # Filter by selected_ids if provided
-        ids_to_process = all_ids & selected_ids if selected_ids else all_ids
+        # Score all goal metrics at once, then build each report; metrics without a goal are unscored
+        goal_scores = self.calculate_goal_scores()
+        unscored = (None, _STATUS_UNKNOWN)
 
-        # Build scores for each metric
-        return {metric_id: self.build_metric_score(metric_id) for metric_id in ids_to_process}
+        reports = {}
+        for metric_id in ids_to_process:
+            score_value, status = goal_scores.get(metric_id, unscored)
+            reports[metric_id] = self._score_report(metric_id, status, score_value)
+        return reports
 
     def evaluate(self, sector_metrics: Dict[str, Dict[str, Any]], dust_decay_per_step: float = 0.0) -> EvaluationResult:
         """
@@ -277,8 +360,13 @@ class EvaluationEngine:
         # Build comprehensive score report
         scores = self.build_all_scores()
 
+        # Results are kept per step (logs, policies), so they need a snapshot rather than a live view. Steps that
+        # leave every metric unchanged share the previous snapshot instead of copying again
+        if self._metrics_snapshot is None:
+            self._metrics_snapshot = self.performance_metrics.copy()
+
         return EvaluationResult(
-            performance_metrics=self.performance_metrics.copy(),
+            performance_metrics=self._metrics_snapshot,
             scores=scores,
             aggregated_contributions=aggregated_contrib,
         )
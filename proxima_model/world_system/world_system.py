@@ -5,6 +5,7 @@ PROXIMA LUNAR SIMULATION - WORLD SYSTEM ORCHESTRATOR
 """
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 import logging
 
@@ -38,6 +39,15 @@ class WorldSystem(Model):
         self.sectors: Dict[str, Any] = {}
         self._initialize_sectors()
 
+        # Optional thread-parallel sector stepping. Events published during a sector step are deferred and
+        # replayed in sector order once all sectors have stepped, so sectors cannot react to each other mid-step.
+        self.parallel_sector_step = bool(self.config.get("parallel_sector_step", False))
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max(1, len(self.sectors)), thread_name_prefix="sector")
+            if self.parallel_sector_step
+            else None
+        )
+
         # Initialize evaluation engine
         goals_cfg = self.config.get("goals", {}) or {}
         performance_goals_data = goals_cfg.get("performance_goals", []) or []
@@ -58,6 +68,12 @@ class WorldSystem(Model):
         # Initialize policy engine (uses evaluation engine internally)
         self.policy = PolicyEngine(self)
 
+    def close(self) -> None:
+        """Shut down the parallel stepping pool, if any; later steps run sectors serially. Safe to call twice."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
     def _initialize_sectors(self) -> None:
         """Initialize all sectors dynamically using the factory."""
         agents_config = self.config.get("agents_config", {})
@@ -89,6 +105,24 @@ class WorldSystem(Model):
 
         return sector_metrics
 
+    def _step_sector_deferred(self, sector, alloc: float) -> list:
+        """Step one sector, returning the events it published instead of dispatching them."""
+        with self.event_bus.defer_events() as events:
+            sector.step(alloc)
+        return events
+
+    def _step_sectors_parallel(self, power_consumers: Dict[str, Any], sector_allocations: Dict[str, float]) -> None:
+        """Step sectors concurrently, then publish their events on this thread in sector order."""
+        futures = [
+            self._executor.submit(self._step_sector_deferred, sector, sector_allocations.get(name, 0.0))
+            for name, sector in power_consumers.items()
+            if hasattr(sector, "step")
+        ]
+
+        for future in futures:
+            for event_type, kwargs in future.result():
+                self.event_bus.publish(event_type, **kwargs)
+
     def step(self) -> None:
         """Execute a single simulation step with dynamic sector handling."""
 
@@ -103,10 +137,13 @@ class WorldSystem(Model):
         sector_allocations = energy_sector.allocate_power(sector_demands) if energy_sector else {}
 
         # Step each sector with its allocation
-        for name, sector in power_consumers.items():
-            alloc = sector_allocations.get(name, 0.0)
-            if hasattr(sector, "step"):
-                sector.step(alloc)
+        if self._executor:
+            self._step_sectors_parallel(power_consumers, sector_allocations)
+        else:
+            for name, sector in power_consumers.items():
+                alloc = sector_allocations.get(name, 0.0)
+                if hasattr(sector, "step"):
+                    sector.step(alloc)
 
         # Collect metrics from all sectors
         sector_metrics = self._collect_sector_metrics()
@@ -10,7 +10,7 @@ Single source of truth for shared configuration and constants.
 Universal definitions that are not sector-specific.
 """
 
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Dict
 from dataclasses import dataclass
 
@@ -20,27 +20,32 @@ from dataclasses import dataclass
 # =============================================================================
 
 
-class EventType(Enum):
-    """Standard event types published on the event bus."""
+class EventType(IntEnum):
+    """
+    Standard event types published on the event bus.
+
+    Values are dense integer ids so the event bus can index its handler table directly.
+    """
 
     # Construction events
-    CONSTRUCTION_REQUEST = "construction_request"
-    MODULE_COMPLETED = "module_completed"
-    SHELL_PRODUCED = "shell_produced"
+    CONSTRUCTION_REQUEST = 0
+    MODULE_COMPLETED = 1
+    SHELL_PRODUCED = 2
 
     # Equipment events
-    EQUIPMENT_REQUEST = "equipment_request"
-    EQUIPMENT_ALLOCATED = "equipment_allocated"
-    EQUIPMENT_DELIVERY_CONFIRMED = "equipment_delivery_confirmed"
+    EQUIPMENT_REQUEST = 3
+    EQUIPMENT_ALLOCATED = 4
+    EQUIPMENT_DELIVERY_CONFIRMED = 5
 
     # Payload/Transportation events
-    PAYLOAD_DELIVERY = "payload_delivered"
-    PAYLOAD_REQUEST = "payload_request"
-    TRANSPORT_REQUEST = "transport_request"
+    PAYLOAD_DELIVERY = 6
+    PAYLOAD_REQUEST = 7
+    TRANSPORT_REQUEST = 8
 
     # Manufacturing
-    RESOURCE_REQUEST = "resource_request"
-    RESOURCE_ALLOCATED = "resource_allocated"
+    RESOURCE_REQUEST = 9
+    RESOURCE_ALLOCATED = 10
+    RESOURCE_ALLOCATED_BATCH = 11
 
 
 # =============================================================================
@@ -57,6 +62,7 @@ class RunnerConfig:
     host_update_frequency: int = 600
     default_step_delay: float = 0.01
     log_flush_interval: int = 1000  # Flush logs every N steps to manage memory
+    background_logging: bool = True  # Write logs from a background thread instead of the simulation loop
     experiment = "exp_001"
 
 
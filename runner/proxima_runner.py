@@ -61,7 +61,6 @@ class ProximaRunner:
         # Setup database connections
         self.local_db = ProximaDB(uri=self.config.local_uri)
         self.hosted_db = ProximaDB(uri=self.config.hosted_uri) if self.config.hosted_uri else None
-        self.local_db.db.db.logs_simulation.delete_many({})  # Clear old logs
 
         # Load experiment configuration from DB
         exp_config = self.local_db.find_by_id("experiments", self.config.experiment)
@@ -70,8 +69,23 @@ class ProximaRunner:
         self.exp_id = exp_config["_id"]
 
         # Setup logging and simulation state
-        self.logger = DataLogger(experiment_id=self.exp_id, db=self.local_db, ws_id=self.ws_id)
-        self.hosted_logger = DataLogger(experiment_id=self.exp_id, db=self.hosted_db, ws_id=self.ws_id) if self.hosted_db else None
+        self.logger = DataLogger(
+            experiment_id=self.exp_id,
+            db=self.local_db,
+            ws_id=self.ws_id,
+            background=self.config.background_logging,
+            reset=True,  # Clear old logs
+        )
+        self.hosted_logger = (
+            DataLogger(
+                experiment_id=self.exp_id,
+                db=self.hosted_db,
+                ws_id=self.ws_id,
+                background=self.config.background_logging,  # Hosted writes pay network RTT; keep them off the step
+            )
+            if self.hosted_db
+            else None
+        )
         self.is_running = False
         self.is_paused = False
         self.continuous = True
@@ -140,15 +154,20 @@ class ProximaRunner:
     def _finalize_run(self):
         """Finalize the run by saving logs and resetting state."""
 
-        self.logger.save_to_file()
-
-        if self.hosted_logger:
-            self.hosted_logger.save_to_file()
-
         self.is_running = False
         self.is_paused = False
         self._update_world_system_state()
 
+        # Write out everything still queued or buffered, including the final state above
+        self.logger.close()
+
+        if self.hosted_logger:
+            self.hosted_logger.close()
+
+        # Stop the world system's sector stepping threads, if it uses any
+        if self.ws:
+            self.ws.close()
+
     def _process_commands(self):
         """Process runtime commands from the database (pause, resume, stop, set_delay)."""
 
@@ -0,0 +1,28 @@
+from mesa import Model
+
+from proxima_model.components.isru import ISRUMode
+from proxima_model.event_engine.event_bus import EventBus
+from proxima_model.sphere_engine.manufacturing_sector import ManufacturingSector, TaskType
+
+
+class _Model(Model):
+    def __init__(self):
+        super().__init__(seed=1)
+        self.config = {}
+
+
+def _sector(**config):
+    return ManufacturingSector(
+        _Model(), {"seed": 1, "isru_robots": [{"quantity": 3, "config": {}}], **config}, EventBus()
+    )
+
+
+def test_task_override_without_isru_mode_keeps_builtin_mode():
+    sector = _sector(custom_tasks=[{"name": "he3", "primary_output": "He3_kg"}])
+
+    assert sector.task_definitions[TaskType.HE3].isru_mode == "HE3_GENERATION"
+
+    sector.step(1000.0)
+
+    modes = [robot.operational_mode for robot in sector.isru_robots]
+    assert ISRUMode.HE3_GENERATION in modes
@@ -0,0 +1,26 @@
+from mesa import Model
+
+from proxima_model.event_engine.event_bus import EventBus
+from proxima_model.sphere_engine.science_sector import ScienceSector
+
+ROVER_CONFIG = {
+    "quantity": 3,
+    "config": {"power_usage_kWh": 3, "battery_capacity_kWh": 10, "current_battery_kWh": 4, "science_generation": 0.5},
+}
+
+
+def _sector(**config):
+    return ScienceSector(Model(seed=1), {"seed": 1, "science_rovers": [ROVER_CONFIG], **config}, EventBus())
+
+
+def test_throttle_change_refreshes_growth_inputs_in_event_mode():
+    sector = _sector(growth_update_mode="event")
+    sector.step(100.0)
+    sector.control_science_growth_rate(0.1, 6)
+    p_eff_unthrottled = sector.get_metrics()["p_eff"]
+
+    sector.set_throttle_factor(0.5)
+    sector.control_science_growth_rate(0.1, 6)
+
+    assert sector.utilization_factor_u == 0.5
+    assert sector.get_metrics()["p_eff"] == 0.5 * p_eff_unthrottled
@@ -0,0 +1,48 @@
+import json
+import random
+from pathlib import Path
+
+import numpy as np
+
+from proxima_model.world_system.world_system import WorldSystem
+from proxima_model.world_system.world_system_builder import build_world_system_config
+
+EXAMPLE_DB = Path(__file__).resolve().parent.parent / "example_mongo_db"
+
+
+class _ExampleDB:
+    """Read-only stand-in for ProximaDB backed by the example database export."""
+
+    def __init__(self):
+        self._collections = {
+            path.name.split(".")[1]: json.loads(path.read_text()) for path in EXAMPLE_DB.glob("proxima_db.*.json")
+        }
+
+    def find_by_id(self, collection, _id):
+        return next((doc for doc in self._collections[collection] if doc["_id"] == _id), None)
+
+    def list_all(self, collection):
+        return list(self._collections[collection])
+
+
+def _run(parallel: bool, steps: int = 100) -> dict:
+    random.seed(1)
+    np.random.seed(1)
+    config = build_world_system_config("ws_beta_1", "exp_001", _ExampleDB())
+    config["parallel_sector_step"] = parallel
+    for sector_config in config["agents_config"].values():
+        sector_config["seed"] = 7
+
+    ws = WorldSystem(config, 100)
+    try:
+        for _ in range(steps):
+            ws.step()
+        return ws.model_metrics
+    finally:
+        ws.close()
+
+
+def test_parallel_sector_step_matches_sequential():
+    # The example world publishes transport, resource and equipment requests mid-step; in parallel mode they are
+    # deferred and replayed in sector order
+    assert _run(parallel=True) == _run(parallel=False)